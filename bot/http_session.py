@@ -0,0 +1,46 @@
+"""
+Shared HTTP Session for Polymarket AutoTrader
+
+Pooled keep-alive requests.Sessions for exchange/Polymarket calls (SESSION)
+and the Polygon JSON-RPC endpoint (RPC_SESSION), so repeated polls reuse
+TCP/TLS connections instead of handshaking every time.
+
+Usage:
+    from http_session import SESSION, json_loads
+
+    resp = SESSION.get(url, timeout=5)
+    data = json_loads(resp.content)
+"""
+
+import json
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Transient failures and rate limits are retried quickly by urllib3. Once the
+# retries are used up the last response is returned (not raised), so callers'
+# status_code checks behave as before. Retry-After is ignored: honouring it would
+# let a rate-limited call sleep far past its timeout= inside a worker thread.
+_RETRY = Retry(
+    total=2,
+    backoff_factor=0.1,
+    status_forcelist=(429, 500, 502, 503, 504),
+    raise_on_status=False,
+    respect_retry_after_header=False,
+)
+
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=_RETRY))
+
+# Separate small pool for the Polygon JSON-RPC endpoint (balance polls)
+RPC_SESSION = requests.Session()
+RPC_SESSION.headers["Connection"] = "keep-alive"
+RPC_SESSION.mount("https://", HTTPAdapter(pool_connections=2, pool_maxsize=4, max_retries=_RETRY))
+
+# orjson is an optional speedup for decoding API responses (parses bytes directly)
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
@@ -15,28 +15,46 @@ RULES:
 4. Skip weak/mixed signals
 """
 
+import atexit
+import itertools
 import os
+import queue
+import signal
 import sys
+import threading
 import time
 import json
 import logging
 import sqlite3
-import requests
-from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict, namedtuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import wait as futures_wait
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from dataclasses import asdict, dataclass, field, fields
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple, Union
 from dotenv import load_dotenv
 from web3 import Web3
 from eth_account import Account
+from eth_abi import decode as abi_decode, encode as abi_encode
 
 # Add parent for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from py_clob_client.client import ClobClient
-from py_clob_client.clob_types import OrderArgs, OrderType
+from py_clob_client.clob_types import ApiCreds, OrderArgs, OrderType
 from py_clob_client.constants import POLYGON
 
+# Bot-local modules: flat when run from bot/, package-qualified when imported as bot.*
+try:
+    from order_stream import OrderFillStream
+    from telegram_handler import get_telegram_bot
+except ImportError:
+    from bot.order_stream import OrderFillStream
+    from bot.telegram_handler import get_telegram_bot
+
 # Load environment
 load_dotenv()
 
@@ -83,6 +101,14 @@ BASE_POSITION_USD = 5.0         # Base position size
 MAX_POSITION_USD = 15.0         # Maximum position size
 MIN_BET_USD = 1.10              # Polymarket minimum
 
+# Balance tiers: (balance below, max base size, fraction of balance) - first match wins
+POSITION_SIZE_TIERS = (
+    (50, BASE_POSITION_USD, 0.15),
+    (100, BASE_POSITION_USD, 0.10),
+    (200, BASE_POSITION_USD * 1.5, 0.08),
+    (float('inf'), MAX_POSITION_USD, 0.05),
+)
+
 # Position averaging (buying more when price improves)
 # DISABLED Jan 18, 2026: Averaging amplified losses on XRP Down trade from $4.79 to $9.59
 # The logic interpreted dropping prices as "better entry" when it was actually the market
@@ -94,6 +120,16 @@ AVERAGING_SIZE_MULTIPLIER = 0.5  # Only add 50% of normal position (reduce downs
 MAX_ADDS_PER_POSITION = 2       # Max times we can add to a position
 MAX_TOTAL_POSITION_USD = 25.0   # Max total position size after adding
 
+# Seconds to reuse an on-chain USDC balance read (0 disables caching)
+BALANCE_CACHE_TTL = float(os.getenv("BALANCE_CACHE_TTL", "3.0"))
+
+# Order fill polling (exponential backoff, capped at ORDER_FILL_WAIT_MS total)
+ORDER_FILL_WAIT_MS = int(os.getenv("ORDER_FILL_WAIT_MS", "2500"))
+ORDER_POLL_DELAYS = (0.05, 0.1, 0.2, 0.4, 0.5, 0.5, 0.5, 0.5)
+# Order states after which size_matched can no longer change
+ORDER_TERMINAL_STATUSES = frozenset({"MATCHED", "FILLED", "CANCELED", "CANCELLED", "REJECTED"})
+ENABLE_USER_WS_FILLS = True     # Wait on user WebSocket fill events (falls back to REST polling)
+
 # Risk management
 MAX_POSITIONS = 4               # Max concurrent positions (1 per crypto)
 MAX_DAILY_LOSS_USD = 30.0       # Stop trading if daily loss exceeds this
@@ -103,13 +139,24 @@ MAX_DRAWDOWN_PCT = 0.30         # Stop if drawdown exceeds 30%
 SCAN_INTERVAL = 10              # Check every 10 seconds
 CRYPTOS = ['BTC', 'ETH', 'SOL', 'XRP']
 
-# State file
-STATE_FILE = Path(__file__).parent.parent / "state" / "intra_epoch_state.json"
+# File locations (computed once at import)
+PROJECT_ROOT = Path(__file__).parent.parent
+STATE_FILE = PROJECT_ROOT / "state" / "intra_epoch_state.json"
+STATE_SAVE_INTERVAL = 1.0       # Seconds, min gap between debounced state writes
+SIGNALS_DB_FILE = PROJECT_ROOT / "state" / "intra_signals.db"
+LOG_DIR = Path(os.getenv("INTRA_LOG_DIR", str(PROJECT_ROOT)))
+BOT_LOG_FILE = LOG_DIR / "intra_epoch_bot.log"
+GRANULAR_LOG_FILE = LOG_DIR / "granular_signals.log"
+CLOB_CREDS_FILE = Path.home() / ".cache" / "polymarket" / "creds.json"  # Derived L2 API creds (0600)
 
 # Web3 / Redemption constants
 RPC_URL = "https://polygon-rpc.com"
 CTF_ADDRESS = "0x4D97DCd97eC945f40cF65F87097ACe5EA0476045"
 USDC_ADDRESS = "0x2791Bca1f2de4661ED88A30C99A7a9449Aa84174"
+USDC_MICROS = 1_000_000          # USDC has 6 decimals
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+REDEEMABLE_CACHE_TTL = 30        # Seconds to reuse the redeemable positions response
+REDEEMABLE_VALUE_CACHE_TTL = 15  # Seconds to reuse the redeemable value used by risk checks
 CTF_ABI = [{
     "name": "redeemPositions",
     "type": "function",
@@ -126,6 +173,28 @@ TELEGRAM_BOT_TOKEN = os.getenv("TELEGRAM_BOT_TOKEN", "")
 TELEGRAM_CHAT_ID = os.getenv("TELEGRAM_AUTHORIZED_USER_ID", "")
 TELEGRAM_ENABLED = os.getenv("TELEGRAM_NOTIFICATIONS_ENABLED", "false").lower() == "true"
 
+
+@dataclass(frozen=True, slots=True)
+class WalletConfig:
+    """Wallet credentials, read from the environment once at startup."""
+    private_key: str
+    wallet: str
+
+    @classmethod
+    def from_env(cls) -> "WalletConfig":
+        return cls(
+            private_key=os.getenv("POLYMARKET_PRIVATE_KEY", ""),
+            wallet=os.getenv("POLYMARKET_WALLET", "")
+        )
+
+    def missing(self) -> List[str]:
+        """Names of required env vars that are not set."""
+        return [name for name, value in (("POLYMARKET_PRIVATE_KEY", self.private_key),
+                                         ("POLYMARKET_WALLET", self.wallet)) if not value]
+
+
+CONFIG = WalletConfig.from_env()
+
 # =============================================================================
 # GRANULAR SIGNAL ENHANCEMENT CONFIGURATION
 # =============================================================================
@@ -165,13 +234,36 @@ log = logging.getLogger(__name__)
 
 # Also log to file
 file_handler = logging.FileHandler(
-    Path(__file__).parent.parent / "intra_epoch_bot.log"
+    BOT_LOG_FILE
 )
 file_handler.setFormatter(logging.Formatter(
     '%(asctime)s | %(levelname)s | %(message)s'
 ))
 log.addHandler(file_handler)
 
+# Log banner separators
+_SEP40 = "-" * 40
+_SEP50 = "=" * 50
+_SEP60 = "=" * 60
+
+# =============================================================================
+# HTTP SESSION
+# =============================================================================
+
+# Pooled keep-alive sessions shared with the other bots (see http_session.py)
+try:
+    from http_session import RPC_SESSION, SESSION, json_loads
+except ImportError:
+    from bot.http_session import RPC_SESSION, SESSION, json_loads
+
+
+def _get_json(url: str, timeout: float) -> Optional[Any]:
+    """GET url on the shared session and decode JSON, or None on a non-200 status."""
+    resp = SESSION.get(url, timeout=timeout)
+    if resp.status_code != 200:
+        return None
+    return json_loads(resp.content)
+
 # =============================================================================
 # TELEGRAM NOTIFICATIONS
 # =============================================================================
@@ -183,7 +275,7 @@ def send_telegram(message: str, silent: bool = False) -> bool:
 
     try:
         url = f"https://api.telegram.org/bot{TELEGRAM_BOT_TOKEN}/sendMessage"
-        resp = requests.post(url, json={
+        resp = SESSION.post(url, json={
             "chat_id": TELEGRAM_CHAT_ID,
             "text": message,
             "parse_mode": "HTML",
@@ -205,19 +297,20 @@ def notify_trade(
     confluence_count: int = 0,
     is_averaging: bool = False
 ):
-    """Send trade notification via telegram_handler."""
-    from telegram_handler import get_telegram_bot
-    bot = get_telegram_bot()
-    # Convert accuracy from decimal to percentage for telegram_handler
-    accuracy_pct = accuracy * 100 if accuracy <= 1 else accuracy
-    magnitude_pct = magnitude_boost * 100 if magnitude_boost <= 1 else magnitude_boost
-    bot.notify_trade(
+    """
+    Send trade notification via telegram_handler.
+
+    accuracy and magnitude_boost are decimals (0.0-1.0), as produced by
+    analyze_pattern() and calculate_magnitude_boost(); telegram_handler
+    expects percentages.
+    """
+    get_telegram_bot().notify_trade(
         crypto=crypto,
         direction=direction,
         entry_price=entry_price,
         size=size,
-        accuracy=accuracy_pct,
-        magnitude_pct=magnitude_pct,
+        accuracy=accuracy * 100.0,
+        magnitude_pct=magnitude_boost * 100.0,
         confluence_count=confluence_count,
         is_averaging=is_averaging
     )
@@ -225,7 +318,6 @@ def notify_trade(
 
 def notify_result(crypto: str, direction: str, is_win: bool, profit: float, balance: float, win_rate: float = 0.0):
     """Send trade result notification via telegram_handler."""
-    from telegram_handler import get_telegram_bot
     telegram = get_telegram_bot()
     if is_win:
         telegram.notify_win(crypto, direction, profit, balance, win_rate)
@@ -235,21 +327,18 @@ def notify_result(crypto: str, direction: str, is_win: bool, profit: float, bala
 
 def notify_alert(message: str, level: str = "warning"):
     """Send alert notification via telegram_handler."""
-    from telegram_handler import get_telegram_bot
     telegram = get_telegram_bot()
     telegram.notify_alert(message, level=level)
 
 
 def notify_halt(reason: str, balance: float, drawdown_pct: float = None):
     """Send halt notification via telegram_handler."""
-    from telegram_handler import get_telegram_bot
     telegram = get_telegram_bot()
     telegram.notify_halt(reason, balance, drawdown_pct)
 
 
 def notify_resumed(balance: float, drawdown_pct: float):
     """Send resumed notification via telegram_handler."""
-    from telegram_handler import get_telegram_bot
     telegram = get_telegram_bot()
     telegram.notify_resumed(balance, drawdown_pct)
 
@@ -262,7 +351,7 @@ class AutoRedeemer:
     """Automatically redeem winning positions."""
 
     def __init__(self):
-        private_key = os.getenv("POLYMARKET_PRIVATE_KEY")
+        private_key = CONFIG.private_key
         if not private_key:
             self.enabled = False
             log.warning("AutoRedeemer disabled: No private key")
@@ -272,24 +361,53 @@ class AutoRedeemer:
         self.w3 = Web3(Web3.HTTPProvider(RPC_URL))
         self.account = Account.from_key(private_key)
         self.ctf = self.w3.eth.contract(address=CTF_ADDRESS, abi=CTF_ABI)
-        self.wallet = os.getenv("POLYMARKET_WALLET", self.account.address)
+        self.wallet = CONFIG.wallet or self.account.address
+
+        # Redeemable positions only change when a market resolves
+        self._pos_cache: Tuple[float, List[Dict]] = (0.0, [])
+        self._pos_last_modified: Optional[str] = None
 
     def get_redeemable_positions(self) -> List[Dict]:
-        """Fetch positions marked as redeemable."""
+        """Fetch positions marked as redeemable (cached for REDEEMABLE_CACHE_TTL seconds)."""
         if not self.enabled:
             return []
 
+        cached_at, cached = self._pos_cache
+        if cached_at and time.monotonic() - cached_at < REDEEMABLE_CACHE_TTL:
+            return cached
+
         try:
-            resp = requests.get(
+            headers = {}
+            if self._pos_last_modified:
+                headers["If-Modified-Since"] = self._pos_last_modified
+
+            resp = SESSION.get(
                 "https://data-api.polymarket.com/positions",
                 params={"user": self.wallet, "redeemable": "true", "limit": 20},
+                headers=headers,
                 timeout=10
             )
-            return resp.json() if resp.status_code == 200 else []
+
+            if resp.status_code == 304:
+                # Unchanged since last fetch - skip the JSON parse
+                self._pos_cache = (time.monotonic(), cached)
+                return cached
+            if resp.status_code != 200:
+                return []
+
+            positions = json_loads(resp.content)
+            self._pos_cache = (time.monotonic(), positions)
+            self._pos_last_modified = resp.headers.get("Last-Modified")
+            return positions
         except Exception as e:
             log.warning(f"Failed to fetch redeemable positions: {e}")
             return []
 
+    def invalidate_positions_cache(self) -> None:
+        """Force the next get_redeemable_positions() call to hit the API."""
+        self._pos_cache = (0.0, [])
+        self._pos_last_modified = None
+
     def redeem_position(self, condition_id: str, nonce: int) -> bool:
         """Redeem a single position on-chain."""
         if not self.enabled:
@@ -359,8 +477,9 @@ class AutoRedeemer:
                 nonce += 1
 
         if redeemed > 0:
+            # Redeemed positions are gone - don't serve them from cache
+            self.invalidate_positions_cache()
             log.info(f"Redeemed {redeemed} positions for ${total_value:.2f}")
-            from telegram_handler import get_telegram_bot
             get_telegram_bot().notify_redemption(redeemed, total_value)
 
         return redeemed, total_value
@@ -370,6 +489,35 @@ class AutoRedeemer:
 # STATE MANAGEMENT
 # =============================================================================
 
+@dataclass(slots=True)
+class Position:
+    """Open position for one crypto (serialized to the state file as a plain dict)."""
+    direction: str
+    entry_price: float
+    size: float        # Total USD invested
+    epoch: int
+    accuracy: float = 0.0
+    adds: int = 0      # Track averaging adds
+    inv_entry_price: float = field(init=False, repr=False)
+
+    def __post_init__(self):
+        # A zero price makes the price-improvement check report no improvement
+        self.inv_entry_price = 1.0 / self.entry_price if self.entry_price else 0.0
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'Position':
+        """Build from a state-file dict, ignoring unknown and derived keys."""
+        return cls(**{k: v for k, v in data.items() if k in _POSITION_INIT_FIELDS})
+
+    def to_dict(self) -> dict:
+        data = asdict(self)
+        del data['inv_entry_price']
+        return data
+
+
+_POSITION_INIT_FIELDS = frozenset(f.name for f in fields(Position) if f.init)
+
+
 class BotState:
     """Persistent bot state."""
 
@@ -382,10 +530,12 @@ class BotState:
         self.total_wins = 0
         self.total_losses = 0
         self.daily_pnl = 0.0
-        self.positions = {}  # {crypto: {direction, entry_price, size, epoch}}
+        self.positions: Dict[str, Position] = {}
         self.last_epoch_traded = {}  # {crypto: epoch} - prevent double trading
         self.halted = False
         self.halt_reason = ""
+        self._dirty = False
+        self._last_save = 0.0
 
     def load(self):
         """Load state from file."""
@@ -401,19 +551,44 @@ class BotState:
                     self.total_wins = data.get('total_wins', 0)
                     self.total_losses = data.get('total_losses', 0)
                     self.daily_pnl = data.get('daily_pnl', 0.0)
-                    self.positions = data.get('positions', {})
                     self.last_epoch_traded = data.get('last_epoch_traded', {})
                     self.halted = data.get('halted', False)
                     self.halt_reason = data.get('halt_reason', "")
+                    # Positions last: one bad entry must not drop the rest (or the halt flag)
+                    self.positions = {}
+                    for crypto, pos in data.get('positions', {}).items():
+                        try:
+                            position = Position.from_dict(pos)
+                            if position.entry_price <= 0:
+                                raise ValueError(f"entry price {position.entry_price}")
+                        except (TypeError, ValueError, AttributeError) as e:
+                            log.error(f"Skipping unreadable saved position for {crypto}: {e}")
+                            continue
+                        self.positions[crypto] = position
                 log.info(f"Loaded state: balance=${self.current_balance:.2f}, trades={self.total_trades}")
             except Exception as e:
                 log.error(f"Failed to load state: {e}")
 
+    def mark_dirty(self):
+        """Schedule a save; the main loop writes at most once per STATE_SAVE_INTERVAL."""
+        self._dirty = True
+
+    def flush_if_due(self):
+        """Write pending changes if the debounce interval has passed."""
+        if self._dirty and time.monotonic() - self._last_save >= STATE_SAVE_INTERVAL:
+            self.save()
+
+    def flush(self):
+        """Write pending changes now (shutdown path)."""
+        if self._dirty:
+            self.save()
+
     def save(self):
-        """Save state to file."""
+        """Save state to file immediately (atomic replace)."""
         STATE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = STATE_FILE.with_suffix('.json.tmp')
         try:
-            with open(STATE_FILE, 'w') as f:
+            with open(tmp_path, 'w') as f:
                 json.dump({
                     'starting_balance': self.starting_balance,
                     'current_balance': self.current_balance,
@@ -423,12 +598,15 @@ class BotState:
                     'total_wins': self.total_wins,
                     'total_losses': self.total_losses,
                     'daily_pnl': self.daily_pnl,
-                    'positions': self.positions,
+                    'positions': {crypto: pos.to_dict() for crypto, pos in self.positions.items()},
                     'last_epoch_traded': self.last_epoch_traded,
                     'halted': self.halted,
                     'halt_reason': self.halt_reason,
                     'last_updated': datetime.now(timezone.utc).isoformat()
                 }, f, indent=2)
+            os.replace(tmp_path, STATE_FILE)
+            self._dirty = False
+            self._last_save = time.monotonic()
         except Exception as e:
             log.error(f"Failed to save state: {e}")
 
@@ -442,12 +620,24 @@ class BotState:
 # MARKET DATA
 # =============================================================================
 
+# Last computed epoch, reused while the wall-clock second hasn't changed
+# Structure: (unix_second, (epoch_start, time_in_epoch))
+_epoch_cache: Tuple[int, Tuple[int, int]] = (-1, (0, 0))
+
+
 def get_current_epoch() -> Tuple[int, int]:
     """Get current epoch start and time elapsed."""
-    now = int(time.time())
+    global _epoch_cache
+    # Wall clock is required (epochs are aligned to Unix time); integer ns
+    # avoids the float round-trip near second boundaries
+    now = time.time_ns() // 1_000_000_000
+    if _epoch_cache[0] == now:
+        return _epoch_cache[1]
+
     epoch_start = now // 900 * 900
-    time_in_epoch = now - epoch_start
-    return epoch_start, time_in_epoch
+    result = (epoch_start, now - epoch_start)
+    _epoch_cache = (now, result)
+    return result
 
 
 def fetch_minute_candles(crypto: str, epoch_start: int) -> Optional[List[Dict[str, Union[str, float]]]]:
@@ -472,11 +662,11 @@ def fetch_minute_candles(crypto: str, epoch_start: int) -> Optional[List[Dict[st
             'limit': 15
         }
 
-        resp = requests.get(url, params=params, timeout=5)
+        resp = SESSION.get(url, params=params, timeout=5)
         if resp.status_code != 200:
             return None
 
-        klines = resp.json()
+        klines = json_loads(resp.content)
 
         # Convert to candle dicts with direction, magnitude, and volume
         # Binance kline format: [open_time, open, high, low, close, volume, ...]
@@ -629,6 +819,14 @@ def check_per_minute_magnitude(candles: List[Dict[str, Union[str, float]]], dire
     return (strong_count, weak_count)
 
 
+def _magnitude_by_direction(candles: List[Dict[str, Union[str, float]]]) -> Dict[str, float]:
+    """Total absolute % move of Up and of Down candles, in one pass."""
+    totals = {'Up': 0.0, 'Down': 0.0}
+    for candle in candles:
+        totals[candle['direction']] += abs(candle['change_pct'])
+    return totals
+
+
 def calculate_magnitude_boost(candles: List[Dict[str, Union[str, float]]], direction: str) -> float:
     """
     Calculate accuracy boost based on move strength for a given direction.
@@ -689,6 +887,14 @@ def calculate_magnitude_boost(candles: List[Dict[str, Union[str, float]]], direc
             if isinstance(change_pct, (int, float)):
                 total_magnitude += abs(change_pct) / 100.0
 
+    return _magnitude_boost_from_total(total_magnitude)
+
+
+def _magnitude_boost_from_total(total_magnitude: float) -> float:
+    """Boost for a precomputed total magnitude (decimal, e.g. 0.02 for 2%)."""
+    if not ENABLE_MAGNITUDE_TRACKING:
+        return 0.0
+
     # No boost if below strong move threshold
     if total_magnitude <= STRONG_MOVE_THRESHOLD:
         return 0.0
@@ -721,12 +927,12 @@ def get_binance_price(symbol: str) -> Optional[float]:
         104523.50
     """
     try:
-        resp = requests.get(
+        resp = SESSION.get(
             f"https://api.binance.com/api/v3/ticker/price?symbol={symbol}",
             timeout=2
         )
         if resp.status_code == 200:
-            return float(resp.json()["price"])
+            return float(json_loads(resp.content)["price"])
         return None
     except Exception:
         return None
@@ -751,14 +957,14 @@ def get_kraken_price(symbol: str) -> Optional[float]:
         104521.00
     """
     try:
-        resp = requests.get(
+        resp = SESSION.get(
             f"https://api.kraken.com/0/public/Ticker?pair={symbol}",
             timeout=2
         )
         if resp.status_code != 200:
             return None
 
-        data = resp.json()
+        data = json_loads(resp.content)
         if data.get("error"):
             return None
 
@@ -787,27 +993,31 @@ def get_coinbase_price(symbol: str) -> Optional[float]:
         104525.00
     """
     try:
-        resp = requests.get(
+        resp = SESSION.get(
             f"https://api.coinbase.com/v2/prices/{symbol}/spot",
             timeout=2
         )
         if resp.status_code == 200:
-            return float(resp.json()["data"]["amount"])
+            return float(json_loads(resp.content)["data"]["amount"])
         return None
     except Exception:
         return None
 
 
-def fetch_multi_exchange_prices(crypto: str) -> Dict[str, float]:
+def fetch_multi_exchange_prices(crypto: str, min_exchanges: Optional[int] = None) -> Dict[str, float]:
     """
     Fetch prices from Binance, Kraken, and Coinbase in parallel.
 
-    Uses ThreadPoolExecutor to fetch from all exchanges concurrently with
-    a 2-second timeout per exchange. Returns whatever prices were successfully
-    fetched (may be partial if some exchanges failed).
+    Uses ThreadPoolExecutor to fetch from all exchanges concurrently and
+    collects results in completion order under a single 2-second deadline,
+    so a slow exchange never delays the fast ones. Returns whatever prices
+    were successfully fetched (may be partial if some exchanges failed).
 
     Args:
         crypto: Cryptocurrency symbol (e.g., 'BTC', 'ETH', 'SOL', 'XRP')
+        min_exchanges: Optional early-exit threshold. When set, returns as soon
+                       as this many prices have arrived instead of waiting for
+                       the stragglers.
 
     Returns:
         Dict mapping exchange name to price, e.g.:
@@ -832,34 +1042,79 @@ def fetch_multi_exchange_prices(crypto: str) -> Dict[str, float]:
     # Fetch from all exchanges in parallel using ThreadPoolExecutor
     prices: Dict[str, float] = {}
 
-    with ThreadPoolExecutor(max_workers=3) as executor:
+    executor = ThreadPoolExecutor(max_workers=3)
+    try:
         # Submit all fetch tasks
-        futures = {
-            "binance": executor.submit(get_binance_price, symbols.get("binance", "")),
-            "kraken": executor.submit(get_kraken_price, symbols.get("kraken", "")),
-            "coinbase": executor.submit(get_coinbase_price, symbols.get("coinbase", "")),
+        future_to_exchange = {
+            executor.submit(get_binance_price, symbols.get("binance", "")): "binance",
+            executor.submit(get_kraken_price, symbols.get("kraken", "")): "kraken",
+            executor.submit(get_coinbase_price, symbols.get("coinbase", "")): "coinbase",
         }
 
-        # Collect results with timeout
-        for exchange, future in futures.items():
-            try:
-                price = future.result(timeout=2)
+        # Collect results as they complete, bounded by one overall deadline
+        try:
+            for future in as_completed(future_to_exchange, timeout=2):
+                try:
+                    price = future.result()
+                except Exception:
+                    # Fetch error - skip this exchange
+                    continue
                 if price is not None:
-                    prices[exchange] = price
-            except Exception:
-                # Timeout or other error - skip this exchange
-                pass
+                    prices[future_to_exchange[future]] = price
+                if min_exchanges is not None and len(prices) >= min_exchanges:
+                    break
+        except FuturesTimeoutError:
+            # Deadline hit - keep whatever arrived in time
+            pass
+    finally:
+        # Don't block on stragglers; their own request timeouts bound them
+        executor.shutdown(wait=False, cancel_futures=True)
 
     return prices
 
 
+# Short-lived cache so clustered polls within one scan share exchange fetches
+# Structure: {crypto: (fetched_at_monotonic, prices)}
+MULTI_EXCHANGE_CACHE_TTL = 1.0  # Seconds
+_price_cache: Dict[str, Tuple[float, Dict[str, float]]] = {}
+
+
+def _cached_fetch_multi_exchange_prices(crypto: str, ttl: float = MULTI_EXCHANGE_CACHE_TTL) -> Dict[str, float]:
+    """
+    fetch_multi_exchange_prices() memoized per crypto for ttl seconds.
+
+    Empty results are not cached, so a failed fetch is retried on the next call.
+    """
+    cached = _price_cache.get(crypto)
+    if cached is not None and time.monotonic() - cached[0] < ttl:
+        return cached[1]
+
+    prices = fetch_multi_exchange_prices(crypto)
+    if prices:
+        # Stamp after the fetch: it can take up to its 2s deadline
+        _price_cache[crypto] = (time.monotonic(), prices)
+    return prices
+
+
 # =============================================================================
 # EXCHANGE CONFLUENCE DETECTION
 # =============================================================================
 
+# Fixed exchange order for the price tuples stored below
+EXCHANGES: Tuple[str, ...] = ('binance', 'kraken', 'coinbase')
+
+# Start-of-epoch prices, one field per exchange in EXCHANGES order (0.0 = missing)
+ExchangePrices = namedtuple('ExchangePrices', EXCHANGES)
+
+# Start prices older than this (relative to the newest recorded epoch) are dropped
+EPOCH_RETENTION_SEC = 24 * 3600
+
+# Hard cap on (crypto, epoch) entries kept; oldest are evicted first
+MAX_EPOCH_START_ENTRIES = 512
+
 # Module-level storage for epoch start prices
-# Structure: {crypto: {epoch: {"binance": price, "kraken": price, "coinbase": price}}}
-epoch_start_prices: Dict[str, Dict[int, Dict[str, float]]] = {}
+# Structure: {(crypto, epoch): ExchangePrices(binance, kraken, coinbase)}
+epoch_start_prices: "OrderedDict[Tuple[str, int], ExchangePrices]" = OrderedDict()
 
 
 def record_epoch_start_prices(crypto: str, epoch: int, prices: Dict[str, float]) -> None:
@@ -877,28 +1132,45 @@ def record_epoch_start_prices(crypto: str, epoch: int, prices: Dict[str, float])
     Example:
         >>> prices = fetch_multi_exchange_prices('BTC')
         >>> record_epoch_start_prices('BTC', 1737100200, prices)
-        >>> epoch_start_prices['BTC'][1737100200]
-        {'binance': 104523.50, 'kraken': 104521.00, 'coinbase': 104525.00}
+        >>> epoch_start_prices[('BTC', 1737100200)]
+        ExchangePrices(binance=104523.5, kraken=104521.0, coinbase=104525.0)
 
     Notes:
         - Only stores if at least one exchange price is available
-        - Old epochs are NOT automatically cleaned up (future enhancement)
+        - Prices are stored as an ExchangePrices tuple (0.0 = missing)
+        - Epochs older than EPOCH_RETENTION_SEC before this one are evicted,
+          as are the oldest entries beyond MAX_EPOCH_START_ENTRIES
         - Safe to call multiple times for same epoch (overwrites)
     """
     if not prices:
         return
 
-    # Initialize crypto dict if needed
-    if crypto not in epoch_start_prices:
-        epoch_start_prices[crypto] = {}
+    key = (crypto, epoch)
+    epoch_start_prices[key] = ExchangePrices(
+        prices.get('binance', 0.0),
+        prices.get('kraken', 0.0),
+        prices.get('coinbase', 0.0),
+    )
+    epoch_start_prices.move_to_end(key)
+
+    # Evict expired epochs from the front (entries are recorded in epoch order)
+    cutoff = epoch - EPOCH_RETENTION_SEC
+    while epoch_start_prices:
+        _, oldest_epoch = next(iter(epoch_start_prices))
+        if oldest_epoch >= cutoff:
+            break
+        epoch_start_prices.popitem(last=False)
 
-    # Store the prices for this epoch
-    epoch_start_prices[crypto][epoch] = prices.copy()
+    # Hard cap in case epochs were recorded out of order
+    while len(epoch_start_prices) > MAX_EPOCH_START_ENTRIES:
+        epoch_start_prices.popitem(last=False)
 
 
 def get_exchange_confluence(
     crypto: str,
-    epoch: int
+    epoch: int,
+    use_cache: bool = True,
+    current_prices: Optional[Dict[str, float]] = None
 ) -> Tuple[Optional[str], int, float]:
     """
     Get exchange confluence direction by comparing current prices to epoch start.
@@ -910,6 +1182,10 @@ def get_exchange_confluence(
     Args:
         crypto: Cryptocurrency symbol (e.g., 'BTC', 'ETH', 'SOL', 'XRP')
         epoch: Epoch start timestamp (Unix seconds)
+        use_cache: Reuse prices fetched within the last MULTI_EXCHANGE_CACHE_TTL
+                   seconds (pass False to force a fresh fetch)
+        current_prices: Exchange prices the caller already fetched this scan
+                        (see prefetch_scan_data). Fetched here when None or empty.
 
     Returns:
         Tuple of (direction, agree_count, avg_change_pct):
@@ -929,75 +1205,63 @@ def get_exchange_confluence(
 
     Notes:
         - Change must exceed 0.1% to count as Up/Down (otherwise Flat)
-        - If no start prices recorded, returns (None, 0, 0.0)
+        - If no start prices recorded (or fewer than MIN_EXCHANGES_AGREE
+          exchanges had one), returns (None, 0, 0.0) without fetching
         - Uses MIN_EXCHANGES_AGREE config for threshold
-        - Fetches fresh prices on each call (not cached)
+        - Current prices are cached for MULTI_EXCHANGE_CACHE_TTL seconds when
+          not passed in via current_prices
     """
     # Check if we have start prices for this epoch
-    if crypto not in epoch_start_prices:
-        return (None, 0, 0.0)
-    if epoch not in epoch_start_prices[crypto]:
+    start_prices = epoch_start_prices.get((crypto, epoch))
+    if start_prices is None:
         return (None, 0, 0.0)
 
-    start_prices = epoch_start_prices[crypto][epoch]
+    # Consensus is impossible with too few baselines - skip the network fetch
+    if sum(1 for price in start_prices if price > 0) < MIN_EXCHANGES_AGREE:
+        return (None, 0, 0.0)
 
-    # Fetch current prices from all exchanges
-    current_prices = fetch_multi_exchange_prices(crypto)
+    # Fetch current prices from all exchanges unless the caller has them
+    if not current_prices:
+        if use_cache:
+            current_prices = _cached_fetch_multi_exchange_prices(crypto)
+        else:
+            current_prices = fetch_multi_exchange_prices(crypto)
     if not current_prices:
         return (None, 0, 0.0)
 
-    # Calculate direction for each exchange
-    directions: Dict[str, Tuple[str, float]] = {}  # exchange -> (direction, change_pct)
     change_threshold = 0.001  # 0.1% minimum change to count as Up/Down
 
-    for exchange, current_price in current_prices.items():
-        if exchange not in start_prices:
-            continue
-
-        start_price = start_prices[exchange]
-        if start_price <= 0:
+    # Single pass: count and sum moves per bucket, indexed [Down, Flat, Up]
+    # (Flat changes fall between the thresholds and don't vote)
+    counts = [0, 0, 0]
+    sums = [0.0, 0.0, 0.0]
+    for exchange, start_price in zip(EXCHANGES, start_prices):
+        current_price = current_prices.get(exchange)
+        if current_price is None or start_price <= 0:
             continue
 
-        change_pct = (current_price - start_price) / start_price
+        change = (current_price - start_price) / start_price
+        # Branchless bucket: (True - False) + 1 -> 0 Down, 1 Flat, 2 Up
+        bucket = (change > change_threshold) - (change < -change_threshold) + 1
+        counts[bucket] += 1
+        sums[bucket] += change
 
-        if change_pct > change_threshold:
-            directions[exchange] = ('Up', change_pct)
-        elif change_pct < -change_threshold:
-            directions[exchange] = ('Down', change_pct)
-        else:
-            directions[exchange] = ('Flat', change_pct)
+    down_count, _, up_count = counts
+    down_sum, _, up_sum = sums
 
-    if not directions:
-        return (None, 0, 0.0)
+    # Average change per direction as a percentage, computed once
+    up_avg = up_sum * 100 / up_count if up_count else 0.0
+    down_avg = down_sum * 100 / down_count if down_count else 0.0
 
-    # Count votes for each direction
-    up_count = sum(1 for d, _ in directions.values() if d == 'Up')
-    down_count = sum(1 for d, _ in directions.values() if d == 'Down')
-
-    # Calculate average change for winning direction
     if up_count >= MIN_EXCHANGES_AGREE:
-        up_changes = [c for d, c in directions.values() if d == 'Up']
-        avg_change = sum(up_changes) / len(up_changes) if up_changes else 0.0
-        return ('Up', up_count, avg_change * 100)  # Convert to percentage
+        return ('Up', up_count, up_avg)
     elif down_count >= MIN_EXCHANGES_AGREE:
-        down_changes = [c for d, c in directions.values() if d == 'Down']
-        avg_change = sum(down_changes) / len(down_changes) if down_changes else 0.0
-        return ('Down', down_count, avg_change * 100)  # Convert to percentage
-    else:
-        # No consensus - return the most popular direction even if below threshold
-        max_count = max(up_count, down_count)
-        if max_count > 0:
-            # Return direction with most votes even without consensus
-            if up_count > down_count:
-                up_changes = [c for d, c in directions.values() if d == 'Up']
-                avg_change = sum(up_changes) / len(up_changes) if up_changes else 0.0
-                return (None, up_count, avg_change * 100)
-            else:
-                down_changes = [c for d, c in directions.values() if d == 'Down']
-                avg_change = sum(down_changes) / len(down_changes) if down_changes else 0.0
-                return (None, down_count, avg_change * 100)
-        return (None, 0, 0.0)
+        return ('Down', down_count, down_avg)
 
+    # No consensus - return the most popular direction's votes even if below threshold
+    if up_count > down_count:
+        return (None, up_count, up_avg)
+    return (None, down_count, down_avg)
 
 # =============================================================================
 # GRANULAR SIGNAL COMPARISON LOGGING
@@ -1012,7 +1276,7 @@ if ENABLE_GRANULAR_SHADOW_LOG:
     granular_log.propagate = False
     # Add file handler for granular_signals.log
     granular_handler = logging.FileHandler(
-        Path(__file__).parent.parent / "granular_signals.log"
+        GRANULAR_LOG_FILE
     )
     granular_handler.setFormatter(logging.Formatter(
         '%(asctime)s | %(message)s',
@@ -1065,35 +1329,30 @@ def log_granular_comparison(
         ... )
         # Logs: [GRANULAR] BTC: Pattern=Down(74.0%) Magnitude=1.8%(+3.0%) Confluence=2/3 Down(-2.5%) -> Final=77.0%
     """
-    if not ENABLE_GRANULAR_SHADOW_LOG or granular_log is None:
+    # Skip all formatting when the record would be dropped anyway
+    if not ENABLE_GRANULAR_SHADOW_LOG or granular_log is None or not granular_log.isEnabledFor(logging.INFO):
         return
 
     # Format pattern info
     if pattern_direction:
-        pattern_str = f"Pattern={pattern_direction}({old_accuracy*100:.1f}%)"
+        pattern_str = "Pattern=%s(%.1f%%)" % (pattern_direction, old_accuracy * 100)
     else:
         pattern_str = "Pattern=None"
 
-    # Format magnitude info
-    if magnitude_boost > 0:
-        magnitude_str = f"Magnitude={magnitude_pct:.1f}%(+{magnitude_boost*100:.1f}%)"
-    else:
-        magnitude_str = f"Magnitude={magnitude_pct:.1f}%(+0%)"
-
     # Format confluence info
     if confluence_direction:
-        confluence_str = f"Confluence={confluence_count}/3 {confluence_direction}({confluence_change:+.1f}%)"
+        confluence_str = "Confluence=%d/3 %s(%+.1f%%)" % (confluence_count, confluence_direction, confluence_change)
     elif confluence_count > 0:
-        confluence_str = f"Confluence={confluence_count}/3 NoConsensus({confluence_change:+.1f}%)"
+        confluence_str = "Confluence=%d/3 NoConsensus(%+.1f%%)" % (confluence_count, confluence_change)
     else:
         confluence_str = "Confluence=0/3"
 
-    # Format final accuracy
-    final_str = f"Final={new_accuracy*100:.1f}%"
-
-    # Log the comparison
+    # Log the comparison (magnitude boost shows as +0% when there is none)
     granular_log.info(
-        f"[GRANULAR] {crypto} epoch={epoch}: {pattern_str} {magnitude_str} {confluence_str} -> {final_str}"
+        "[GRANULAR] %s epoch=%d: %s Magnitude=%.1f%%(+%s%%) %s -> Final=%.1f%%",
+        crypto, epoch, pattern_str, magnitude_pct,
+        "%.1f" % (magnitude_boost * 100) if magnitude_boost > 0 else "0",
+        confluence_str, new_accuracy * 100
     )
 
 
@@ -1101,22 +1360,81 @@ def log_granular_comparison(
 # SIGNALS DATABASE - Structured storage for analysis
 # =============================================================================
 
-# Database connection (module-level, initialized on first use)
+# Database connection (module-level, initialized on first use).
+# Only the background writer thread touches it after initialization.
 _signals_db: Optional[sqlite3.Connection] = None
 
+# Writes are queued by the trading loop and applied by _db_writer, so a slow
+# disk never stalls a scan. Items are (tag, params); None stops the writer.
+_db_queue: "queue.SimpleQueue[Optional[Tuple[str, Any]]]" = queue.SimpleQueue()
+_db_writer_thread: Optional[threading.Thread] = None
+
+# SQL kept as module constants so sqlite3's statement cache reuses the parsed statements
+# Re-logging a (crypto, epoch) updates the row in place (UPSERT) rather than
+# delete + insert, so signals.id stays stable for trades.signal_id
+_INSERT_SIGNAL_SQL = """
+    INSERT INTO signals
+    (timestamp, crypto, epoch, direction, pattern_accuracy, magnitude_pct,
+     magnitude_boost, confluence_direction, confluence_count, confluence_change,
+     final_accuracy, entry_price, decision, reason)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(crypto, epoch) DO UPDATE SET
+        timestamp=excluded.timestamp,
+        direction=excluded.direction,
+        pattern_accuracy=excluded.pattern_accuracy,
+        magnitude_pct=excluded.magnitude_pct,
+        magnitude_boost=excluded.magnitude_boost,
+        confluence_direction=excluded.confluence_direction,
+        confluence_count=excluded.confluence_count,
+        confluence_change=excluded.confluence_change,
+        final_accuracy=excluded.final_accuracy,
+        entry_price=excluded.entry_price,
+        decision=excluded.decision,
+        reason=excluded.reason
+"""
+# signal_id is resolved inside the statement; the queue preserves write order,
+# so the signal row for a trade is always written first
+_INSERT_TRADE_SQL = """
+    INSERT INTO trades
+    (signal_id, timestamp, crypto, epoch, direction, entry_price, size,
+     pattern_accuracy, magnitude_pct, confluence_count)
+    VALUES ((SELECT id FROM signals WHERE crypto=? AND epoch=?), ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(crypto, epoch) DO UPDATE SET
+        signal_id=excluded.signal_id,
+        timestamp=excluded.timestamp,
+        direction=excluded.direction,
+        entry_price=excluded.entry_price,
+        size=excluded.size,
+        pattern_accuracy=excluded.pattern_accuracy,
+        magnitude_pct=excluded.magnitude_pct,
+        confluence_count=excluded.confluence_count
+"""
+_UPDATE_TRADE_SQL = "UPDATE trades SET outcome=?, pnl=? WHERE crypto=? AND epoch=?"
+
+_DB_WRITE_SQL: Dict[str, str] = {
+    "signal": _INSERT_SIGNAL_SQL,
+    "trade": _INSERT_TRADE_SQL,
+    "outcome": _UPDATE_TRADE_SQL,
+}
+
 
 def _init_signals_db() -> sqlite3.Connection:
-    """Initialize the signals database, creating tables if needed."""
-    global _signals_db
+    """Initialize the signals database, creating tables and starting the writer thread."""
+    global _signals_db, _db_writer_thread
     if _signals_db is not None:
         return _signals_db
 
-    db_path = Path(__file__).parent.parent / "state" / "intra_signals.db"
-    db_path.parent.mkdir(parents=True, exist_ok=True)
+    SIGNALS_DB_FILE.parent.mkdir(parents=True, exist_ok=True)
 
-    conn = sqlite3.connect(str(db_path), check_same_thread=False)
+    conn = sqlite3.connect(str(SIGNALS_DB_FILE), check_same_thread=False)
     conn.row_factory = sqlite3.Row
 
+    # WAL keeps fsync off the write path; NORMAL is durable enough with WAL
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA cache_size=-20000")
+
     # Create signals table - stores ALL signals for analysis
     conn.execute("""
         CREATE TABLE IF NOT EXISTS signals (
@@ -1168,10 +1486,90 @@ def _init_signals_db() -> sqlite3.Connection:
 
     conn.commit()
     _signals_db = conn
-    log.info(f"Signals database initialized: {db_path}")
+
+    _db_writer_thread = threading.Thread(target=_db_writer, args=(conn,), name="signals-db-writer", daemon=True)
+    _db_writer_thread.start()
+    atexit.register(close_signals_db)
+
+    log.info(f"Signals database initialized: {SIGNALS_DB_FILE}")
     return conn
 
 
+def _db_writer(conn: sqlite3.Connection) -> None:
+    """
+    Apply queued writes to the signals database.
+
+    Blocks for the next item, then drains everything else already queued and
+    commits the whole batch in one transaction. Consecutive writes of the same
+    kind go through a single executemany(). Runs until a None sentinel is
+    received.
+    """
+    while True:
+        batch = [_db_queue.get()]
+        while True:
+            try:
+                batch.append(_db_queue.get_nowait())
+            except queue.Empty:
+                break
+
+        stop = False
+        flushed: List[threading.Event] = []
+        writes: List[Tuple[str, Any]] = []
+        for item in batch:
+            if item is None:
+                stop = True
+            elif item[0] == "flush":
+                flushed.append(item[1])
+            else:
+                writes.append(item)
+
+        # Group runs of the same statement; order across groups is preserved
+        for tag, group in itertools.groupby(writes, key=lambda item: item[0]):
+            rows = [params for _, params in group]
+            try:
+                conn.executemany(_DB_WRITE_SQL[tag], rows)
+            except Exception as e:
+                # Retry row by row so one bad row doesn't drop the rest
+                log.error(f"Error writing {len(rows)} {tag} rows to DB: {e}")
+                for params in rows:
+                    try:
+                        conn.execute(_DB_WRITE_SQL[tag], params)
+                    except Exception as row_error:
+                        log.error(f"Error writing {tag} to DB: {row_error}")
+
+        try:
+            conn.commit()
+        except Exception as e:
+            log.error(f"Error committing signals DB: {e}")
+
+        for event in flushed:
+            event.set()
+        if stop:
+            return
+
+
+def flush_signals_db(timeout: float = 5.0) -> bool:
+    """
+    Block until every write queued so far has been committed.
+
+    Returns:
+        True if the writer caught up within timeout (or nothing was ever written)
+    """
+    if _db_writer_thread is None or not _db_writer_thread.is_alive():
+        return True
+    done = threading.Event()
+    _db_queue.put(("flush", done))
+    return done.wait(timeout)
+
+
+def close_signals_db(timeout: float = 5.0) -> None:
+    """Stop the writer thread after it has applied all queued writes."""
+    if _db_writer_thread is None or not _db_writer_thread.is_alive():
+        return
+    _db_queue.put(None)
+    _db_writer_thread.join(timeout)
+
+
 def log_signal_to_db(
     crypto: str,
     epoch: int,
@@ -1186,9 +1584,12 @@ def log_signal_to_db(
     entry_price: Optional[float],
     decision: str,
     reason: str
-) -> int:
+) -> bool:
     """
-    Log a signal to the database for later analysis.
+    Queue a signal for the database for later analysis.
+
+    The write is applied asynchronously by the DB writer thread, so no row
+    ID is available here; use (crypto, epoch) to look the signal up.
 
     Args:
         crypto: Cryptocurrency symbol
@@ -1206,26 +1607,19 @@ def log_signal_to_db(
         reason: Human-readable reason for decision
 
     Returns:
-        signal_id: ID of inserted signal, or -1 on error
+        True if the write was queued, False on error
     """
     try:
-        conn = _init_signals_db()
-        cursor = conn.execute("""
-            INSERT OR REPLACE INTO signals
-            (timestamp, crypto, epoch, direction, pattern_accuracy, magnitude_pct,
-             magnitude_boost, confluence_direction, confluence_count, confluence_change,
-             final_accuracy, entry_price, decision, reason)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
+        _init_signals_db()
+        _db_queue.put(("signal", (
             time.time(), crypto, epoch, direction, pattern_accuracy, magnitude_pct,
             magnitude_boost, confluence_direction, confluence_count, confluence_change,
             final_accuracy, entry_price, decision, reason
-        ))
-        conn.commit()
-        return cursor.lastrowid
+        )))
+        return True
     except Exception as e:
         log.error(f"Error logging signal to DB: {e}")
-        return -1
+        return False
 
 
 def log_trade_to_db(
@@ -1237,9 +1631,11 @@ def log_trade_to_db(
     pattern_accuracy: float,
     magnitude_pct: float,
     confluence_count: int
-) -> int:
+) -> bool:
     """
-    Log a trade to the database.
+    Queue a trade for the database.
+
+    The trade is linked to the signal logged for the same (crypto, epoch).
 
     Args:
         crypto: Cryptocurrency symbol
@@ -1252,37 +1648,23 @@ def log_trade_to_db(
         confluence_count: Number of exchanges agreeing
 
     Returns:
-        trade_id: ID of inserted trade, or -1 on error
+        True if the write was queued, False on error
     """
     try:
-        conn = _init_signals_db()
-
-        # Find the corresponding signal
-        signal_row = conn.execute(
-            "SELECT id FROM signals WHERE crypto=? AND epoch=?",
-            (crypto, epoch)
-        ).fetchone()
-        signal_id = signal_row[0] if signal_row else None
-
-        cursor = conn.execute("""
-            INSERT OR REPLACE INTO trades
-            (signal_id, timestamp, crypto, epoch, direction, entry_price, size,
-             pattern_accuracy, magnitude_pct, confluence_count)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            signal_id, time.time(), crypto, epoch, direction, entry_price, size,
+        _init_signals_db()
+        _db_queue.put(("trade", (
+            crypto, epoch, time.time(), crypto, epoch, direction, entry_price, size,
             pattern_accuracy, magnitude_pct, confluence_count
-        ))
-        conn.commit()
-        return cursor.lastrowid
+        )))
+        return True
     except Exception as e:
         log.error(f"Error logging trade to DB: {e}")
-        return -1
+        return False
 
 
 def update_trade_outcome(crypto: str, epoch: int, outcome: str, pnl: float):
     """
-    Update a trade with its outcome after resolution.
+    Queue an update of a trade with its outcome after resolution.
 
     Args:
         crypto: Cryptocurrency symbol
@@ -1291,60 +1673,143 @@ def update_trade_outcome(crypto: str, epoch: int, outcome: str, pnl: float):
         pnl: Profit/loss in USD
     """
     try:
-        conn = _init_signals_db()
-        conn.execute(
-            "UPDATE trades SET outcome=?, pnl=? WHERE crypto=? AND epoch=?",
-            (outcome, pnl, crypto, epoch)
-        )
-        conn.commit()
+        _init_signals_db()
+        _db_queue.put(("outcome", (outcome, pnl, crypto, epoch)))
     except Exception as e:
         log.error(f"Error updating trade outcome: {e}")
 
 
-def fetch_polymarket_prices(crypto: str, epoch_start: int) -> Optional[Dict]:
-    """Fetch current Polymarket prices for Up/Down markets."""
+def _best_ask_from_book(book: Dict) -> float:
+    """Extract the best ask (what you pay to buy) from a CLOB order book."""
+    asks = book.get("asks", [])
+    return float(asks[-1]["price"]) if asks else 0.99
+
+
+def _fetch_best_ask(token_id: str) -> Optional[float]:
+    """Fetch the best ask for a single CLOB token, or None on failure."""
     try:
-        slug = f"{crypto.lower()}-updown-15m-{epoch_start}"
+        book = _get_json(f"https://clob.polymarket.com/book?token_id={token_id}", timeout=2)
+        return _best_ask_from_book(book) if book is not None else None
+    except Exception:
+        return None
 
-        # Get market from Gamma API
-        resp = requests.get(f"https://gamma-api.polymarket.com/events?slug={slug}", timeout=3)
-        if resp.status_code != 200 or not resp.json():
-            return None
 
-        event = resp.json()[0]
-        markets = event.get("markets", [])
-        if not markets:
-            return None
+def _fetch_best_asks(token_ids: List[str]) -> Dict[str, float]:
+    """
+    Fetch best asks for several CLOB tokens in one round-trip.
 
-        # Get CLOB data
-        cid = markets[0].get("conditionId")
-        clob = requests.get(f"https://clob.polymarket.com/markets/{cid}", timeout=3)
-        if clob.status_code != 200:
-            return None
+    Uses the batch POST /books endpoint. If that fails, falls back to
+    parallel per-token /book requests.
 
-        tokens = clob.json().get("tokens", [])
-        prices = {}
+    Returns:
+        Dict mapping token_id to best ask (tokens that failed are omitted)
+    """
+    try:
+        resp = SESSION.post(
+            "https://clob.polymarket.com/books",
+            json=[{"token_id": token_id} for token_id in token_ids],
+            timeout=2
+        )
+        if resp.status_code == 200:
+            asks = {
+                book.get("asset_id"): _best_ask_from_book(book)
+                for book in json_loads(resp.content)
+            }
+            if all(token_id in asks for token_id in token_ids):
+                return asks
+    except Exception as e:
+        log.debug(f"Batch order book fetch failed, falling back to per-token: {e}")
+
+    with ThreadPoolExecutor(max_workers=len(token_ids)) as executor:
+        results = executor.map(_fetch_best_ask, token_ids)
+        return {
+            token_id: best_ask
+            for token_id, best_ask in zip(token_ids, results)
+            if best_ask is not None
+        }
 
-        for t in tokens:
-            outcome = t.get("outcome", "")
-            token_id = t.get("token_id", "")
-            if not token_id:
-                continue
 
-            try:
-                book_resp = requests.get(f"https://clob.polymarket.com/book?token_id={token_id}", timeout=2)
-                book = book_resp.json()
-                asks = book.get("asks", [])
-
-                # Best ask (what you pay to buy)
-                best_ask = float(asks[-1]["price"]) if asks else 0.99
-
-                prices[outcome] = {
-                    'ask': best_ask,
-                    'token_id': token_id
-                }
-            except Exception:
+# Resolved market metadata per epoch - conditionId and token IDs never change
+# within an epoch, so only the order book needs refetching on each poll.
+# Structure: {(crypto, epoch_start): (cached_at_monotonic, [(outcome, token_id), ...])}
+MARKET_META_TTL = 900           # One epoch window
+_market_meta_cache: Dict[Tuple[str, int], Tuple[float, List[Tuple[str, str]]]] = {}
+
+
+def get_market_tokens(crypto: str, epoch_start: int) -> Optional[List[Tuple[str, str]]]:
+    """
+    Resolve the (outcome, token_id) pairs for a crypto's 15-minute market.
+
+    Results are memoized per (crypto, epoch_start) for MARKET_META_TTL seconds,
+    saving the Gamma and CLOB market lookups on every poll after the first.
+
+    Returns:
+        List of (outcome, token_id) tuples, or None if the market could not be resolved
+    """
+    now = time.monotonic()
+
+    # Evict entries from past epochs to keep the cache bounded
+    for key in [k for k, (ts, _) in _market_meta_cache.items() if now - ts >= MARKET_META_TTL]:
+        del _market_meta_cache[key]
+
+    cached = _market_meta_cache.get((crypto, epoch_start))
+    if cached is not None:
+        return cached[1]
+
+    slug = f"{crypto.lower()}-updown-15m-{epoch_start}"
+
+    # Get market from Gamma API
+    events = _get_json(f"https://gamma-api.polymarket.com/events?slug={slug}", timeout=3)
+    if not events:
+        return None
+
+    event = events[0]
+    markets = event.get("markets", [])
+    if not markets:
+        return None
+
+    # Get CLOB data
+    cid = markets[0].get("conditionId")
+    market = _get_json(f"https://clob.polymarket.com/markets/{cid}", timeout=3)
+    if market is None:
+        return None
+
+    tokens = [
+        (t.get("outcome", ""), t.get("token_id", ""))
+        for t in market.get("tokens", [])
+        if t.get("token_id")
+    ]
+    if not tokens:
+        return None
+
+    _market_meta_cache[(crypto, epoch_start)] = (now, tokens)
+    return tokens
+
+
+def fetch_polymarket_prices(crypto: str, epoch_start: int) -> Optional[Dict]:
+    """
+    Fetch current Polymarket prices for Up/Down markets.
+
+    Market token IDs come from get_market_tokens() (cached per epoch). Order
+    books for all outcome tokens are fetched with one batch request over the
+    shared keep-alive session (see _fetch_best_asks).
+    """
+    try:
+        tokens = get_market_tokens(crypto, epoch_start)
+        if not tokens:
+            return None
+
+        asks = _fetch_best_asks([token_id for _, token_id in tokens])
+
+        prices = {}
+        for outcome, token_id in tokens:
+            best_ask = asks.get(token_id)
+            if best_ask is None:
                 continue
+            prices[outcome] = {
+                'ask': best_ask,
+                'token_id': token_id
+            }
 
         return prices if 'Up' in prices and 'Down' in prices else None
 
@@ -1356,9 +1821,58 @@ def fetch_polymarket_prices(crypto: str, epoch_start: int) -> Optional[Dict]:
 # PATTERN DETECTION
 # =============================================================================
 
+def _pack_minutes(minutes: List[str]) -> int:
+    """
+    Pack minute directions into a bitmask: bit i is set when minute i was Up.
+
+    Example:
+        >>> _pack_minutes(['Up', 'Down', 'Up'])
+        5  # 0b101
+    """
+    mask = 0
+    for i, m in enumerate(minutes):
+        if m == 'Up':
+            mask |= 1 << i
+    return mask
+
+
+# Pattern 2: all first 3 minutes same direction
+# {first-3 bitmask: (direction, base_accuracy, base_reason)}
+_FIRST3_PATTERN: Dict[int, Tuple[str, float, str]] = {
+    0b111: ('Up', 0.780, "3/3 UP"),
+    0b000: ('Down', 0.739, "3/3 DOWN"),
+}
+
+
+def _build_first5_patterns() -> Dict[int, Tuple[str, float, str]]:
+    """
+    Precompute the pattern decision for every Up/Down combination of the first 5 minutes.
+
+    Applies the same rules as analyze_pattern: 4+ of 5 same direction first,
+    then all first 3 same direction. Combinations with no strong pattern are
+    left out of the table.
+    """
+    table: Dict[int, Tuple[str, float, str]] = {}
+    for first_5 in range(32):
+        ups = first_5.bit_count()
+        downs = 5 - ups
+        if ups >= 4:
+            table[first_5] = ('Up', 0.797, f"{ups}/5 UP")
+        elif downs >= 4:
+            table[first_5] = ('Down', 0.740, f"{downs}/5 DOWN")
+        elif first_5 & 0b111 in _FIRST3_PATTERN:
+            table[first_5] = _FIRST3_PATTERN[first_5 & 0b111]
+    return table
+
+
+# {first-5 bitmask: (direction, base_accuracy, base_reason)} for strong patterns only
+_FIRST5_PATTERN = _build_first5_patterns()
+
+
 def analyze_pattern(
     minutes: List[str],
-    candles: Optional[List[Dict[str, Union[str, float]]]] = None
+    candles: Optional[List[Dict[str, Union[str, float]]]] = None,
+    minutes_mask: Optional[int] = None
 ) -> Tuple[Optional[str], float, str]:
     """
     Analyze minute patterns and return (direction, accuracy, reason).
@@ -1372,6 +1886,8 @@ def analyze_pattern(
         candles: Optional list of candle dicts with magnitude data. If provided,
                  enables magnitude checks and accuracy boosts (US-GS-008).
                  Each dict should have 'direction', 'change_pct', and 'volume'.
+        minutes_mask: Optional _pack_minutes(minutes) result, if the caller
+                      already has it (saves re-packing)
 
     Returns:
         Tuple of (direction, accuracy, reason) where:
@@ -1389,41 +1905,21 @@ def analyze_pattern(
     if not minutes or len(minutes) < 3:
         return (None, 0.0, "Not enough data")
 
-    # Pattern 1: 4+ of first 5 minutes same direction (strongest)
-    if len(minutes) >= 5:
-        first_5 = minutes[:5]
-        ups = sum(1 for m in first_5 if m == 'Up')
-        downs = 5 - ups
+    direction = None
+    base_accuracy = 0.0
+    base_reason = ""
 
-        if ups >= 4:
-            direction = 'Up'
-            base_accuracy = 0.797
-            base_reason = f"{ups}/5 UP"
-        elif downs >= 4:
-            direction = 'Down'
-            base_accuracy = 0.740
-            base_reason = f"{downs}/5 DOWN"
-        else:
-            # No 4/5 pattern, check 3/3 below
-            direction = None
-            base_accuracy = 0.0
-            base_reason = ""
-    else:
-        direction = None
-        base_accuracy = 0.0
-        base_reason = ""
+    if minutes_mask is None:
+        minutes_mask = _pack_minutes(minutes[:5])
 
-    # Pattern 2: All first 3 minutes same direction (only if no 4/5 pattern)
-    if direction is None:
-        first_3 = minutes[:3]
-        if all(m == 'Up' for m in first_3):
-            direction = 'Up'
-            base_accuracy = 0.780
-            base_reason = "3/3 UP"
-        elif all(m == 'Down' for m in first_3):
-            direction = 'Down'
-            base_accuracy = 0.739
-            base_reason = "3/3 DOWN"
+    if len(minutes) >= 5:
+        # Pattern 1 (4+ of first 5) and Pattern 2 (3/3) in one table lookup
+        entry = _FIRST5_PATTERN.get(minutes_mask & 0b11111)
+    else:
+        # Pattern 2: All first 3 minutes same direction
+        entry = _FIRST3_PATTERN.get(minutes_mask & 0b111)
+    if entry is not None:
+        direction, base_accuracy, base_reason = entry
 
     # No strong pattern found
     if direction is None:
@@ -1468,104 +1964,341 @@ def analyze_pattern(
 # TRADING
 # =============================================================================
 
-def get_clob_client() -> Optional[ClobClient]:
-    """Initialize CLOB client for trading."""
+CLOB_HOST = "https://clob.polymarket.com"
+
+_clob_client: Optional[ClobClient] = None
+_clob_lock = threading.Lock()
+
+
+def _load_cached_creds(wallet: str) -> Optional[ApiCreds]:
+    """Load previously derived API creds for this wallet, if any."""
     try:
-        private_key = os.getenv("POLYMARKET_PRIVATE_KEY")
-        wallet = os.getenv("POLYMARKET_WALLET")
+        with open(CLOB_CREDS_FILE) as f:
+            data = json.load(f)
+        if data.get("wallet", "").lower() != wallet.lower():
+            return None
+        return ApiCreds(
+            api_key=data["api_key"],
+            api_secret=data["api_secret"],
+            api_passphrase=data["api_passphrase"]
+        )
+    except (OSError, ValueError, KeyError):
+        return None
 
-        if not private_key:
-            log.error("POLYMARKET_PRIVATE_KEY not set")
+
+def _save_cached_creds(wallet: str, creds: ApiCreds) -> None:
+    """Persist derived API creds (owner read/write only) so restarts skip derivation."""
+    try:
+        CLOB_CREDS_FILE.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(CLOB_CREDS_FILE, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w") as f:
+            json.dump({
+                "wallet": wallet,
+                "api_key": creds.api_key,
+                "api_secret": creds.api_secret,
+                "api_passphrase": creds.api_passphrase
+            }, f)
+        os.chmod(CLOB_CREDS_FILE, 0o600)
+    except OSError as e:
+        log.warning(f"Could not cache CLOB API creds: {e}")
+
+
+def get_clob_client(force_refresh: bool = False) -> Optional[ClobClient]:
+    """
+    Return the process-wide CLOB client, initializing it on first use.
+
+    Initialization (API key derivation) runs at most once even with concurrent
+    callers. Derived creds are cached in CLOB_CREDS_FILE; pass force_refresh=True
+    to rebuild the client and re-derive them.
+    """
+    global _clob_client
+
+    client = _clob_client
+    if client is not None and not force_refresh:
+        return client
+
+    with _clob_lock:
+        if _clob_client is not None and not force_refresh:
+            return _clob_client
+
+        try:
+            wallet = CONFIG.wallet
+            client = ClobClient(
+                host=CLOB_HOST,
+                chain_id=POLYGON,
+                key=CONFIG.private_key,
+                signature_type=0,  # EOA wallet (not POLY_GNOSIS_SAFE)
+                funder=wallet
+            )
+
+            # Attach API credentials (derived once, then reused from disk)
+            creds = None if force_refresh else _load_cached_creds(wallet)
+            if creds is None:
+                creds = client.derive_api_key()
+                _save_cached_creds(wallet, creds)
+            client.set_api_creds(creds)
+
+            _clob_client = client
+            return _clob_client
+
+        except Exception as e:
+            log.error(f"Failed to initialize CLOB client: {e}")
             return None
+
+
+# ABI selectors for the balance calls
+_ERC20_BALANCE_OF = "0x70a08231"   # balanceOf(address)
+_CTF_BALANCE_OF = "0x00fdd58e"     # balanceOf(address,uint256)
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+@lru_cache(maxsize=8)
+def _padded_address(address: str) -> str:
+    """ABI-encode an address as a 32-byte word (hex, no 0x)."""
+    return "0" * 24 + address[2:].lower()
+
+
+@lru_cache(maxsize=8)
+def _usdc_balance_request(wallet: str) -> bytes:
+    """Serialized eth_call body for USDC balanceOf(wallet); built once per wallet."""
+    return json.dumps({
+        'jsonrpc': '2.0',
+        'method': 'eth_call',
+        'params': [{'to': USDC_ADDRESS, 'data': _ERC20_BALANCE_OF + _padded_address(wallet)}, 'latest'],
+        'id': 1
+    }).encode()
+
+
+# Last successful balance read: {"ts": monotonic time, "val": micro-USDC, "wallet": address}
+_BAL_CACHE: Dict[str, Any] = {"ts": 0.0, "val": 0, "wallet": None}
+_BAL_LOCK = threading.Lock()
+
+
+def invalidate_wallet_balance() -> None:
+    """Force the next get_wallet_balance() call to query the chain."""
+    global _chain_cache
+    with _BAL_LOCK:
+        _BAL_CACHE["ts"] = 0.0
+        _chain_cache = None
+
+
+def get_wallet_balance_micros() -> int:
+    """
+    Get current USDC balance from Polygon in integer micro-USDC.
+
+    Successful reads are cached for BALANCE_CACHE_TTL seconds. Call
+    invalidate_wallet_balance() after anything that moves funds.
+    """
+    try:
+        wallet = CONFIG.wallet
         if not wallet:
-            log.error("POLYMARKET_WALLET not set")
-            return None
+            return 0
 
-        # First create client to derive API key
-        client = ClobClient(
-            host="https://clob.polymarket.com",
-            chain_id=POLYGON,
-            key=private_key,
-            signature_type=0,  # EOA wallet (not POLY_GNOSIS_SAFE)
-            funder=wallet
-        )
+        with _BAL_LOCK:
+            if (_BAL_CACHE["wallet"] == wallet and _BAL_CACHE["ts"]
+                    and time.monotonic() - _BAL_CACHE["ts"] < BALANCE_CACHE_TTL):
+                return _BAL_CACHE["val"]
 
-        # Derive API credentials
-        creds = client.derive_api_key()
-
-        # Create new client with credentials
-        return ClobClient(
-            host="https://clob.polymarket.com",
-            chain_id=POLYGON,
-            key=private_key,
-            signature_type=0,
-            funder=wallet,
-            creds=creds
-        )
+        snapshot = _poll_chain_state()
+        if snapshot is not None:
+            micros = snapshot.usdc_micros
+        else:
+            # Multicall read failed - fall back to a plain balanceOf call
+            resp = RPC_SESSION.post(RPC_URL, data=_usdc_balance_request(wallet),
+                                     headers=_JSON_HEADERS, timeout=5)
+            body = json_loads(resp.content)
+            result = body.get('result')
+            if result is None:
+                # JSON-RPC error (e.g. rate limited) - don't cache it as a 0 balance
+                raise ValueError(f"balanceOf RPC error: {body.get('error')}")
+            micros = int(result, 16)
+
+        with _BAL_LOCK:
+            _BAL_CACHE.update(ts=time.monotonic(), val=micros, wallet=wallet)
+        return micros
 
     except Exception as e:
-        log.error(f"Failed to initialize CLOB client: {e}")
-        return None
+        log.warning(f"Failed to get balance: {e}")
+        return 0
 
 
 def get_wallet_balance() -> float:
-    """Get current USDC balance from Polygon."""
-    try:
-        wallet = os.getenv("POLYMARKET_WALLET")
-        if not wallet:
-            return 0.0
+    """Get current USDC balance from Polygon (dollars)."""
+    return get_wallet_balance_micros() / USDC_MICROS
+
+
+RPC_BATCH_LIMIT = 10  # Max eth_calls per JSON-RPC batch (public endpoints reject large batches)
 
-        rpc = "https://polygon-rpc.com"
-        usdc = "0x2791Bca1f2de4661ED88A30C99A7a9449Aa84174"
 
-        # balanceOf call
-        data = f"0x70a08231000000000000000000000000{wallet[2:]}"
-        resp = requests.post(rpc, json={
+def _rpc_eth_calls(calls: List[Tuple[str, str]]) -> List[Optional[str]]:
+    """
+    Run eth_calls as JSON-RPC batches, one POST per RPC_BATCH_LIMIT calls.
+
+    Args:
+        calls: (to, data) pairs
+
+    Returns:
+        Hex result per call (None if that call failed), in input order
+
+    Notes:
+        If the endpoint rejects batching (non-200 or a non-list body) the
+        chunk is retried one call per request.
+    """
+    results: List[Optional[str]] = [None] * len(calls)
+    for offset in range(0, len(calls), RPC_BATCH_LIMIT):
+        chunk = calls[offset:offset + RPC_BATCH_LIMIT]
+        payload = [{
             'jsonrpc': '2.0',
             'method': 'eth_call',
-            'params': [{'to': usdc, 'data': data}, 'latest'],
+            'params': [{'to': to, 'data': data}, 'latest'],
+            'id': offset + i
+        } for i, (to, data) in enumerate(chunk)]
+
+        try:
+            resp = RPC_SESSION.post(RPC_URL, json=payload, timeout=5)
+            body = json_loads(resp.content) if resp.status_code == 200 else None
+        except Exception as e:
+            log.debug(f"Batch eth_call failed: {e}")
+            body = None
+
+        if isinstance(body, list):
+            for item in body:
+                idx = item.get('id')
+                if isinstance(idx, int) and 0 <= idx < len(calls):
+                    results[idx] = item.get('result')
+            continue
+
+        # Fallback: sequential single calls
+        for req in payload:
+            try:
+                resp = RPC_SESSION.post(RPC_URL, json=req, timeout=5)
+                results[req['id']] = json_loads(resp.content).get('result')
+            except Exception as e:
+                log.debug(f"eth_call {req['id']} failed: {e}")
+
+    return results
+
+
+def get_balances_batch(token_ids: List[str]) -> Dict[str, float]:
+    """
+    Get outcome-token (CTF ERC-1155) share balances for the wallet in one round trip.
+
+    Args:
+        token_ids: Polymarket CLOB token IDs (decimal strings)
+
+    Returns:
+        Dict of token_id -> shares held. Tokens whose call failed are omitted.
+    """
+    wallet = CONFIG.wallet
+    if not wallet or not token_ids:
+        return {}
+
+    prefix = _CTF_BALANCE_OF + _padded_address(wallet)
+    calls = [(CTF_ADDRESS, f"{prefix}{int(token_id):064x}") for token_id in token_ids]
+
+    balances = {}
+    for token_id, result in zip(token_ids, _rpc_eth_calls(calls)):
+        if result:
+            balances[token_id] = int(result, 16) / USDC_MICROS
+    return balances
+
+
+# One consistent view of on-chain state, read in a single eth_call
+ChainSnapshot = namedtuple('ChainSnapshot', ['block_number', 'usdc_micros', 'token_balances'])
+
+_MULTICALL3_AGGREGATE = bytes.fromhex("252dba42")  # aggregate((address,bytes)[])
+# Latest snapshot only: (monotonic time, token_ids, snapshot). Token IDs change every
+# epoch, so keeping one entry per token set would grow without bound.
+_chain_cache: Optional[Tuple[float, Tuple[str, ...], ChainSnapshot]] = None
+
+
+def _poll_chain_state(token_ids: Tuple[str, ...] = ()) -> Optional[ChainSnapshot]:
+    """
+    Read block number, USDC balance and outcome-token balances via Multicall3.
+
+    Args:
+        token_ids: CLOB token IDs to include (CTF balanceOf per token)
+
+    Returns:
+        ChainSnapshot (token balances in shares), or None on failure.
+        The latest snapshot is reused for BALANCE_CACHE_TTL seconds when
+        token_ids match.
+    """
+    global _chain_cache
+
+    wallet = CONFIG.wallet
+    if not wallet:
+        return None
+
+    now = time.monotonic()
+    cached = _chain_cache
+    if cached and cached[1] == token_ids and now - cached[0] < BALANCE_CACHE_TTL:
+        return cached[2]
+
+    try:
+        owner = bytes.fromhex(_padded_address(wallet))
+        calls = [(USDC_ADDRESS, bytes.fromhex(_ERC20_BALANCE_OF[2:]) + owner)]
+        calls += [
+            (CTF_ADDRESS, bytes.fromhex(_CTF_BALANCE_OF[2:]) + owner + int(token_id).to_bytes(32, 'big'))
+            for token_id in token_ids
+        ]
+        data = _MULTICALL3_AGGREGATE + abi_encode(['(address,bytes)[]'], [calls])
+
+        resp = RPC_SESSION.post(RPC_URL, json={
+            'jsonrpc': '2.0',
+            'method': 'eth_call',
+            'params': [{'to': MULTICALL3_ADDRESS, 'data': '0x' + data.hex()}, 'latest'],
             'id': 1
         }, timeout=5)
+        result = json_loads(resp.content).get('result')
+        if not result:
+            return None
 
-        result = resp.json().get('result', '0x0')
-        return int(result, 16) / 1e6
-
+        block_number, returns = abi_decode(['uint256', 'bytes[]'], bytes.fromhex(result[2:]))
+        balances = [int.from_bytes(r, 'big') for r in returns]
+        snapshot = ChainSnapshot(
+            block_number=block_number,
+            usdc_micros=balances[0],
+            token_balances={t: b / USDC_MICROS for t, b in zip(token_ids, balances[1:])}
+        )
     except Exception as e:
-        log.warning(f"Failed to get balance: {e}")
-        return 0.0
+        log.warning(f"Multicall chain read failed: {e}")
+        return None
+
+    _chain_cache = (now, token_ids, snapshot)
+    return snapshot
 
 
 def calculate_position_size(balance: float, accuracy: float, existing_size: float = 0.0) -> float:
     """Calculate position size based on balance and signal accuracy."""
     # Base size scales with balance
-    if balance < 50:
-        base = min(BASE_POSITION_USD, balance * 0.15)
-    elif balance < 100:
-        base = min(BASE_POSITION_USD, balance * 0.10)
-    elif balance < 200:
-        base = min(BASE_POSITION_USD * 1.5, balance * 0.08)
-    else:
-        base = min(MAX_POSITION_USD, balance * 0.05)
+    for ceiling, cap, fraction in POSITION_SIZE_TIERS:
+        if balance < ceiling:
+            base = min(cap, balance * fraction)
+            break
 
     # Scale by accuracy (79.7% gets full size, 74% gets 90%)
-    accuracy_multiplier = 0.9 + (accuracy - 0.74) * 2.0  # 0.9 to 1.12
+    accuracy_multiplier = min(1.12, max(0.9, 0.9 + (accuracy - 0.74) * 2.0))
 
-    size = base * accuracy_multiplier
+    # Enforce limits - if averaging, also don't exceed max total position
+    max_add = MAX_TOTAL_POSITION_USD - existing_size if existing_size > 0 else MAX_POSITION_USD
+    size = min(MAX_POSITION_USD, max(MIN_BET_USD, base * accuracy_multiplier), max_add)
 
-    # Enforce limits
-    size = max(MIN_BET_USD, min(MAX_POSITION_USD, size))
+    return round(size, 2)
 
-    # If averaging, make sure we don't exceed max total position
-    if existing_size > 0:
-        max_add = MAX_TOTAL_POSITION_USD - existing_size
-        size = min(size, max_add)
 
-    return round(size, 2)
+# Fixed rejection results (no per-call string formatting)
+_AVG_DISABLED = (False, "Averaging disabled")
+_AVG_DIRECTION_MISMATCH = (False, "Pattern direction != position direction")
+_AVG_MAX_ADDS = (False, f"Max adds reached ({MAX_ADDS_PER_POSITION}/{MAX_ADDS_PER_POSITION})")
+_AVG_MAX_SIZE = (False, "Max position size reached")
+_AVG_LOW_IMPROVEMENT = (False, f"Price improvement < {PRICE_IMPROVE_THRESHOLD:.0%} threshold")
+_AVG_DROP_TOO_LARGE = (False, f"Price dropped > {MAX_PRICE_DROP_FOR_AVERAGING:.0%} - signal may be wrong, not averaging")
 
 
 def check_averaging_opportunity(
     crypto: str,
-    position: dict,
+    position: Position,
     current_price: float,
     pattern_direction: str
 ) -> Tuple[bool, str]:
@@ -1576,38 +2309,41 @@ def check_averaging_opportunity(
         (should_add, reason)
     """
     if not ENABLE_POSITION_AVERAGING:
-        return (False, "Averaging disabled")
+        return _AVG_DISABLED
 
     # Must be same direction as existing position
-    if pattern_direction != position['direction']:
-        return (False, f"Pattern {pattern_direction} != position {position['direction']}")
+    if pattern_direction != position.direction:
+        return _AVG_DIRECTION_MISMATCH
 
     # Check if we've already maxed out adds
-    adds = position.get('adds', 0)
-    if adds >= MAX_ADDS_PER_POSITION:
-        return (False, f"Max adds reached ({adds}/{MAX_ADDS_PER_POSITION})")
+    if position.adds >= MAX_ADDS_PER_POSITION:
+        return _AVG_MAX_ADDS
 
     # Check if we're already at max position size
-    current_size = position['size']
-    if current_size >= MAX_TOTAL_POSITION_USD:
-        return (False, f"Max position size reached (${current_size:.2f})")
+    if position.size >= MAX_TOTAL_POSITION_USD:
+        return _AVG_MAX_SIZE
 
     # Check if price has improved enough
-    entry_price = position['entry_price']
-    improvement = (entry_price - current_price) / entry_price
+    entry_price = position.entry_price
+    improvement = (entry_price - current_price) * position.inv_entry_price
 
     if improvement < PRICE_IMPROVE_THRESHOLD:
-        return (False, f"Price improvement {improvement:.1%} < {PRICE_IMPROVE_THRESHOLD:.0%} threshold")
+        return _AVG_LOW_IMPROVEMENT
 
     # NEW: Stop averaging if price dropped too much - this signals the trade is likely wrong
     # In binary markets, price drop = market saying our direction is LESS likely
     if improvement > MAX_PRICE_DROP_FOR_AVERAGING:
-        return (False, f"Price dropped {improvement:.1%} > {MAX_PRICE_DROP_FOR_AVERAGING:.0%} - signal may be wrong, not averaging")
+        return _AVG_DROP_TOO_LARGE
 
     # All checks passed
     return (True, f"Price improved {improvement:.1%} (${entry_price:.2f} -> ${current_price:.2f})")
 
 
+# Order constants resolved once (OrderType.GTC is the plain string "GTC")
+_ORDER_TYPE_GTC = OrderType.GTC
+_SIDE_BUY = "BUY"
+
+
 def place_trade(client: ClobClient, crypto: str, direction: str,
                 token_id: str, price: float, size_usd: float) -> Tuple[bool, float]:
     """
@@ -1622,37 +2358,44 @@ def place_trade(client: ClobClient, crypto: str, direction: str,
 
         # Shadow mode - log but don't execute
         if SHADOW_MODE:
-            log.info(f"🔮 SHADOW ORDER: {crypto} {direction} @ ${price:.2f}, ${size_usd:.2f} ({shares:.1f} shares)")
-            log.info(f"   [Shadow mode - no real trade placed]")
+            log.info("🔮 SHADOW ORDER: %s %s @ $%.2f, $%.2f (%.1f shares)", crypto, direction, price, size_usd, shares)
+            log.info("   [Shadow mode - no real trade placed]")
             return (True, size_usd)  # Simulate successful fill
 
-        log.info(f"Placing order: {crypto} {direction} @ ${price:.2f}, ${size_usd:.2f} ({shares:.1f} shares)")
-
-        order_args = OrderArgs(
-            price=price,
-            size=shares,
-            side="BUY",
-            token_id=token_id
-        )
+        log.info("Placing order: %s %s @ $%.2f, $%.2f (%.1f shares)", crypto, direction, price, size_usd, shares)
 
-        signed_order = client.create_order(order_args)
-        response = client.post_order(signed_order, OrderType.GTC)
+        signed_order = client.create_order(OrderArgs(price=price, size=shares, side=_SIDE_BUY, token_id=token_id))
+        response = client.post_order(signed_order, _ORDER_TYPE_GTC)
 
         if not response or not response.get("success"):
-            log.error(f"Order placement failed: {response}")
+            log.error("Order placement failed: %s", response)
             return (False, 0.0)
 
         order_id = response.get("orderID")
         if not order_id:
-            log.error(f"No order ID in response: {response}")
+            log.error("No order ID in response: %s", response)
             return (False, 0.0)
 
-        log.info(f"Order submitted: {order_id}")
+        log.info("Order submitted: %s", order_id)
 
-        # Wait briefly for order to fill (check multiple times)
+        # Prefer push fill events from the user WebSocket when it's connected
         filled_shares = 0.0
-        for attempt in range(5):  # Check 5 times over ~2.5 seconds
-            time.sleep(0.5)
+        poll_delays = ORDER_POLL_DELAYS
+        ws_filled = (_fill_stream.wait_for_fill(order_id, shares, ORDER_FILL_WAIT_MS / 1000.0)
+                     if _fill_stream else None)
+        if ws_filled is not None:
+            filled_shares = ws_filled
+            # The stream only saves the polling wait; one REST read stays the source of truth
+            poll_delays = (0.0,)
+
+        # Poll for fills with a short backoff - most orders fill (or don't) within
+        # a few hundred ms, so check early and stop as soon as the state is final
+        deadline = time.monotonic() + ORDER_FILL_WAIT_MS / 1000.0
+        for attempt, delay in enumerate(poll_delays):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            time.sleep(min(delay, remaining))
 
             try:
                 order_status = client.get_order(order_id)
@@ -1661,195 +2404,320 @@ def place_trade(client: ClobClient, crypto: str, direction: str,
                     original_size = float(order_status.get("original_size", shares))
                     fill_pct = (filled_shares / original_size * 100) if original_size > 0 else 0
 
-                    if filled_shares > 0:
-                        log.info(f"Order fill check {attempt+1}: {filled_shares:.1f}/{original_size:.1f} shares ({fill_pct:.0f}%)")
+                    if filled_shares > 0 and log.isEnabledFor(logging.INFO):
+                        log.info("Order fill check %d: %.1f/%.1f shares (%.0f%%)",
+                                 attempt + 1, filled_shares, original_size, fill_pct)
 
-                    # If fully filled, we're done
-                    if fill_pct >= 99:
+                    # If fully filled or the order is done, we're done
+                    status = str(order_status.get("status", "")).upper()
+                    if fill_pct >= 99 or status in ORDER_TERMINAL_STATUSES:
                         break
             except Exception as e:
-                log.warning(f"Error checking order status: {e}")
+                log.warning("Error checking order status: %s", e)
 
         # Calculate filled USD value
         filled_usd = filled_shares * price
 
+        # Any fill moves USDC - don't serve a stale cached balance
+        if filled_shares > 0:
+            invalidate_wallet_balance()
+
         # Determine if order was sufficiently filled (at least 50%)
         min_fill_pct = 0.50
         if filled_shares >= shares * min_fill_pct:
-            log.info(f"ORDER FILLED: {crypto} {direction} - ${filled_usd:.2f} @ ${price:.2f} ({filled_shares:.1f} shares)")
+            log.info("ORDER FILLED: %s %s - $%.2f @ $%.2f (%.1f shares)", crypto, direction, filled_usd, price, filled_shares)
 
-            # Cancel any remaining unfilled portion
+            # Cancel any remaining unfilled portion (outcome is known - don't wait on it)
             if filled_shares < shares * 0.99:
-                try:
-                    client.cancel(order_id)
-                    log.info(f"Cancelled unfilled remainder of order {order_id}")
-                except Exception as e:
-                    log.warning(f"Could not cancel remainder: {e}")
+                _cancel_in_background(client, order_id,
+                                      "Cancelled unfilled remainder of order %s",
+                                      "Could not cancel remainder: %s")
 
             return (True, filled_usd)
         else:
             # Order didn't fill enough - cancel it
-            log.warning(f"Order not filled (got {filled_shares:.1f}/{shares:.1f} shares). Cancelling...")
-            try:
-                client.cancel(order_id)
-                log.info(f"Cancelled unfilled order {order_id}")
-            except Exception as e:
-                log.warning(f"Could not cancel order: {e}")
+            log.warning("Order not filled (got %.1f/%.1f shares). Cancelling...", filled_shares, shares)
+            _cancel_in_background(client, order_id,
+                                  "Cancelled unfilled order %s",
+                                  "Could not cancel order: %s")
 
             # If we got partial fill, still return that amount
             if filled_shares > 0:
-                log.info(f"Partial fill kept: ${filled_usd:.2f}")
+                log.info("Partial fill kept: $%.2f", filled_usd)
                 return (True, filled_usd)
 
             return (False, 0.0)
 
     except Exception as e:
-        log.error(f"Failed to place trade: {e}")
+        log.error("Failed to place trade: %s", e)
         return (False, 0.0)
 
+
+# User-channel fill listener, started by run_bot() for live trading
+_fill_stream: Optional[OrderFillStream] = None
+
+# Order placement is I/O bound (post + fill polling) - run independent orders side by side
+_order_executor = ThreadPoolExecutor(max_workers=MAX_POSITIONS, thread_name_prefix="order")
+
+
+def _cancel_in_background(client: ClobClient, order_id: str, ok_msg: str, fail_msg: str) -> None:
+    """Submit client.cancel(order_id) on the order pool and log the result when it lands."""
+    def _done(future):
+        error = future.exception()
+        if error:
+            log.warning(fail_msg, error)
+        else:
+            log.info(ok_msg, order_id)
+
+    _order_executor.submit(client.cancel, order_id).add_done_callback(_done)
+
+
+def place_trades(
+    client: ClobClient,
+    orders: List[Tuple[str, str, str, float, float]]
+) -> List[Tuple[bool, float]]:
+    """
+    Place several trades concurrently and wait for all fill checks.
+
+    Args:
+        client: CLOB client (thread-safe for independent orders)
+        orders: (crypto, direction, token_id, price, size_usd) per trade
+
+    Returns:
+        place_trade() result for each order, in input order
+    """
+    if len(orders) <= 1:
+        return [place_trade(client, *order) for order in orders]
+    futures = [_order_executor.submit(place_trade, client, *order) for order in orders]
+    return [f.result() for f in futures]
+
 # =============================================================================
 # MAIN BOT LOOP
 # =============================================================================
 
-def resolve_completed_positions(state: BotState, orchestrator=None) -> None:
-    """Check and resolve any positions from completed epochs."""
-    if not state.positions:
-        return
+# Scan fetches are I/O bound - run them side by side (candles, prices, exchanges per crypto)
+_scan_executor = ThreadPoolExecutor(max_workers=len(CRYPTOS) * 3, thread_name_prefix="scan")
 
-    current_epoch, _ = get_current_epoch()
 
-    positions_to_remove = []
+def prefetch_scan_data(cryptos: List[str], epoch_start: int) -> Dict[str, Dict[str, Any]]:
+    """
+    Fetch every crypto's scan inputs concurrently.
 
-    for crypto, pos in state.positions.items():
-        pos_epoch = pos['epoch']
+    Minute candles, Polymarket prices and (when ENABLE_MULTI_EXCHANGE is set)
+    multi-exchange prices are returned; pass the latter to
+    get_exchange_confluence(current_prices=...) so the per-crypto loop does
+    not fetch them again. Fetches still running after SCAN_INTERVAL seconds
+    are treated as failed.
 
-        # Position is from a past epoch - it's resolved
-        if pos_epoch < current_epoch:
-            direction = pos['direction']
-            entry_price = pos['entry_price']
-            size = pos['size']
+    Args:
+        cryptos: Symbols to scan
+        epoch_start: Current epoch start timestamp
 
-            # Fetch the final outcome from that epoch
-            # We check if the price moved in our direction
-            outcome = check_epoch_outcome(crypto, pos_epoch)
+    Returns:
+        {crypto: {'candles': candles or None, 'prices': prices or None,
+                  'exchange_prices': exchange prices or None}}
+    """
+    jobs = {}
+    for crypto in cryptos:
+        jobs[(crypto, 'candles')] = _scan_executor.submit(fetch_minute_candles, crypto, epoch_start)
+        jobs[(crypto, 'prices')] = _scan_executor.submit(fetch_polymarket_prices, crypto, epoch_start)
+        if ENABLE_MULTI_EXCHANGE:
+            jobs[(crypto, 'exchange_prices')] = _scan_executor.submit(fetch_multi_exchange_prices, crypto)
 
-            # Notify shadow trading orchestrator of the outcome
-            if orchestrator and outcome:
-                try:
-                    orchestrator.on_epoch_resolution(crypto.lower(), pos_epoch, outcome)
-                except Exception as e:
-                    log.error(f"Shadow trading resolution error: {e}")
+    futures_wait(jobs.values(), timeout=SCAN_INTERVAL)
 
-            if outcome is None:
-                log.warning(f"{crypto}: Could not determine outcome for epoch {pos_epoch}")
-                positions_to_remove.append(crypto)
-                continue
+    results = {crypto: {'candles': None, 'prices': None, 'exchange_prices': None} for crypto in cryptos}
+    for (crypto, kind), future in jobs.items():
+        if future.done() and not future.exception():
+            results[crypto][kind] = future.result()
+    return results
 
-            if outcome == direction:
-                # WIN - we get $1.00 per share
-                shares = size / entry_price
-                payout = shares * 1.0
-                profit = payout - size
 
-                state.total_wins += 1
-                state.daily_pnl += profit
-                state.current_balance += profit
+def resolve_completed_positions(state: BotState, orchestrator=None, current_epoch: Optional[int] = None) -> None:
+    """Check and resolve any positions from completed epochs (before current_epoch, default now)."""
+    if not state.positions:
+        return
 
-                log.info(f"")
-                log.info(f"{'='*50}")
-                log.info(f"WIN: {crypto} {direction}")
-                log.info(f"  Entry: ${entry_price:.2f}, Size: ${size:.2f}")
-                log.info(f"  Payout: ${payout:.2f}, Profit: ${profit:.2f}")
-                log.info(f"  Balance: ${state.current_balance:.2f}")
-                log.info(f"{'='*50}")
+    if current_epoch is None:
+        current_epoch, _ = get_current_epoch()
 
-                # Telegram notification
-                notify_result(crypto, direction, True, profit, state.current_balance, state.win_rate())
+    # Positions from a past epoch are resolved
+    past = [(crypto, pos) for crypto, pos in state.positions.items() if pos.epoch < current_epoch]
+    if not past:
+        return
 
-                # Update trade outcome in signals database
-                update_trade_outcome(crypto, pos_epoch, "WIN", profit)
+    # Fetch the final outcomes from those epochs concurrently
+    # We check if the price moved in our direction
+    outcomes = _scan_executor.map(lambda item: check_epoch_outcome(item[0], item[1].epoch), past)
 
-            else:
-                # LOSS - position is worthless
-                state.total_losses += 1
-                state.daily_pnl -= size
-                state.current_balance -= size
+    positions_to_remove = set()
 
-                log.info(f"")
-                log.info(f"{'='*50}")
-                log.info(f"LOSS: {crypto} {direction} (actual: {outcome})")
-                log.info(f"  Entry: ${entry_price:.2f}, Size: ${size:.2f}")
-                log.info(f"  Loss: -${size:.2f}")
-                log.info(f"  Balance: ${state.current_balance:.2f}")
-                log.info(f"{'='*50}")
+    for (crypto, pos), outcome in zip(past, outcomes):
+        pos_epoch = pos.epoch
+        direction = pos.direction
+        entry_price = pos.entry_price
+        size = pos.size
 
-                # Telegram notification
-                notify_result(crypto, direction, False, -size, state.current_balance, state.win_rate())
+        # Notify shadow trading orchestrator of the outcome
+        if orchestrator and outcome:
+            try:
+                orchestrator.on_epoch_resolution(crypto.lower(), pos_epoch, outcome)
+            except Exception as e:
+                log.error(f"Shadow trading resolution error: {e}")
 
-                # Update trade outcome in signals database
-                update_trade_outcome(crypto, pos_epoch, "LOSS", -size)
+        if outcome is None:
+            log.warning(f"{crypto}: Could not determine outcome for epoch {pos_epoch}")
+            positions_to_remove.add(crypto)
+            continue
 
-            positions_to_remove.append(crypto)
+        if outcome == direction:
+            # WIN - we get $1.00 per share
+            shares = size / entry_price
+            payout = shares * 1.0
+            profit = payout - size
+
+            state.total_wins += 1
+            state.daily_pnl += profit
+            state.current_balance += profit
+
+            if log.isEnabledFor(logging.INFO):
+                log.info("\n".join((
+                    "",
+                    _SEP50,
+                    f"WIN: {crypto} {direction}",
+                    f"  Entry: ${entry_price:.2f}, Size: ${size:.2f}",
+                    f"  Payout: ${payout:.2f}, Profit: ${profit:.2f}",
+                    f"  Balance: ${state.current_balance:.2f}",
+                    _SEP50,
+                )))
+
+            # Telegram notification
+            notify_result(crypto, direction, True, profit, state.current_balance, state.win_rate())
+
+            # Update trade outcome in signals database
+            update_trade_outcome(crypto, pos_epoch, "WIN", profit)
 
-    # Remove resolved positions
-    for crypto in positions_to_remove:
-        del state.positions[crypto]
+        else:
+            # LOSS - position is worthless
+            state.total_losses += 1
+            state.daily_pnl -= size
+            state.current_balance -= size
+
+            if log.isEnabledFor(logging.INFO):
+                log.info("\n".join((
+                    "",
+                    _SEP50,
+                    f"LOSS: {crypto} {direction} (actual: {outcome})",
+                    f"  Entry: ${entry_price:.2f}, Size: ${size:.2f}",
+                    f"  Loss: -${size:.2f}",
+                    f"  Balance: ${state.current_balance:.2f}",
+                    _SEP50,
+                )))
+
+            # Telegram notification
+            notify_result(crypto, direction, False, -size, state.current_balance, state.win_rate())
+
+            # Update trade outcome in signals database
+            update_trade_outcome(crypto, pos_epoch, "LOSS", -size)
+
+        positions_to_remove.add(crypto)
 
     if positions_to_remove:
+        # Remove resolved positions
+        state.positions = {k: v for k, v in state.positions.items() if k not in positions_to_remove}
+
         # Update peak balance
         if state.current_balance > state.peak_balance:
             state.peak_balance = state.current_balance
-        state.save()
+        state.mark_dirty()
 
         # Log stats
         win_rate = state.total_wins / state.total_trades * 100 if state.total_trades > 0 else 0
-        log.info(f"Stats: {state.total_wins}W/{state.total_losses}L ({win_rate:.1f}%) | Daily P&L: ${state.daily_pnl:.2f}")
+        log.info("Stats: %dW/%dL (%.1f%%) | Daily P&L: $%.2f",
+                 state.total_wins, state.total_losses, win_rate, state.daily_pnl)
+
+
+# Closed 15m klines by (crypto, open time in seconds) -> (open, close).
+# One fetch covers the requested epoch and the ones after it, so catching up
+# on several positions for a symbol costs a single request.
+OUTCOME_KLINE_LIMIT = 50
+MAX_OUTCOME_KLINES = 2048
+_outcome_klines: "OrderedDict[Tuple[str, int], Tuple[float, float]]" = OrderedDict()
+_outcome_lock = threading.Lock()  # Outcomes for several cryptos are fetched concurrently
+
+
+def _fetch_outcome_klines(crypto: str, epoch_start: int) -> None:
+    """Fetch closed 15m klines from epoch_start onward into _outcome_klines."""
+    resp = SESSION.get("https://api.binance.com/api/v3/klines", params={
+        'symbol': f"{crypto}USDT",
+        'interval': '15m',
+        'startTime': epoch_start * 1000,
+        'limit': OUTCOME_KLINE_LIMIT
+    }, timeout=5)
+    if resp.status_code != 200:
+        return
 
+    # Binance kline format: [open_time, open, high, low, close, volume, close_time, ...]
+    now_ms = time.time() * 1000
+    with _outcome_lock:
+        for k in json_loads(resp.content):
+            if k[6] >= now_ms:
+                break  # Still open - outcome not final
+            key = (crypto, k[0] // 1000)
+            _outcome_klines[key] = (float(k[1]), float(k[4]))
+            _outcome_klines.move_to_end(key)
 
-def check_epoch_outcome(crypto: str, epoch_start: int) -> Optional[str]:
-    """Check the actual outcome of a completed epoch."""
-    try:
-        symbol = f"{crypto}USDT"
-        url = "https://api.binance.com/api/v3/klines"
+        while len(_outcome_klines) > MAX_OUTCOME_KLINES:
+            _outcome_klines.popitem(last=False)
 
-        # Fetch the 15-minute candle for that epoch
-        params = {
-            'symbol': symbol,
-            'interval': '15m',
-            'startTime': epoch_start * 1000,
-            'limit': 1
-        }
 
-        resp = requests.get(url, params=params, timeout=5)
-        if resp.status_code != 200:
+def check_epoch_outcome(crypto: str, epoch_start: int) -> Optional[str]:
+    """Check the actual outcome of a completed epoch."""
+    key = (crypto, epoch_start)
+    kline = _outcome_klines.get(key)
+    if kline is None:
+        try:
+            _fetch_outcome_klines(crypto, epoch_start)
+        except Exception as e:
+            log.warning(f"Failed to check outcome for {crypto}: {e}")
             return None
-
-        klines = resp.json()
-        if not klines:
+        kline = _outcome_klines.get(key)
+        if kline is None:
             return None
 
-        # Compare open to close
-        open_price = float(klines[0][1])
-        close_price = float(klines[0][4])
+    # Compare open to close
+    open_price, close_price = kline
+    return 'Up' if close_price > open_price else 'Down'
 
-        if close_price > open_price:
-            return 'Up'
-        else:
-            return 'Down'
 
-    except Exception as e:
-        log.warning(f"Failed to check outcome for {crypto}: {e}")
-        return None
+# Last successful redeemable value: (monotonic time, USD)
+_redeemable_value_cache: Tuple[float, float] = (0.0, 0.0)
+
+
+def invalidate_redeemable_value() -> None:
+    """Force the next get_redeemable_value() call to hit the API."""
+    global _redeemable_value_cache
+    _redeemable_value_cache = (0.0, 0.0)
 
 
 def get_redeemable_value() -> float:
-    """Get total value of redeemable positions from API."""
+    """
+    Get total value of redeemable positions from API.
+
+    Successful reads are cached for REDEEMABLE_VALUE_CACHE_TTL seconds.
+    """
+    global _redeemable_value_cache
+
+    cached_at, cached_value = _redeemable_value_cache
+    if cached_at and time.monotonic() - cached_at < REDEEMABLE_VALUE_CACHE_TTL:
+        return cached_value
+
     try:
-        wallet = os.getenv("POLYMARKET_WALLET")
+        wallet = CONFIG.wallet
         if not wallet:
             return 0.0
 
-        resp = requests.get(
+        resp = SESSION.get(
             "https://data-api.polymarket.com/positions",
             params={"user": wallet, "redeemable": "true", "limit": 50},
             timeout=10
@@ -1858,12 +2726,10 @@ def get_redeemable_value() -> float:
         if resp.status_code != 200:
             return 0.0
 
-        positions = resp.json()
-        total = 0.0
-        for pos in positions:
-            size = float(pos.get('size', 0))
-            total += size  # Redeemable positions are worth $1 per share
+        # Redeemable positions are worth $1 per share
+        total = sum(float(pos.get('size', 0)) for pos in json_loads(resp.content))
 
+        _redeemable_value_cache = (time.monotonic(), total)
         return total
 
     except Exception as e:
@@ -1900,13 +2766,13 @@ def check_risk_limits(state: BotState) -> bool:
 
 def run_bot():
     """Main bot loop."""
-    log.info("=" * 60)
+    log.info(_SEP60)
     if SHADOW_MODE:
         log.info("🔮 INTRA-EPOCH MOMENTUM BOT - SHADOW MODE 🔮")
         log.info("   (No real trades - observation only)")
     else:
         log.info("INTRA-EPOCH MOMENTUM BOT STARTING")
-    log.info("=" * 60)
+    log.info(_SEP60)
     log.info(f"Edge Buffer: {EDGE_BUFFER:.0%} (max entry = accuracy - {EDGE_BUFFER:.0%}, cap ${MAX_ENTRY_PRICE_CAP:.2f})")
     log.info(f"Min Pattern Accuracy: {MIN_PATTERN_ACCURACY:.0%}")
     log.info(f"Trading Window: minutes 3-10")
@@ -1921,7 +2787,7 @@ def run_bot():
     log.info(f"Telegram Alerts: {'ENABLED' if TELEGRAM_ENABLED else 'DISABLED'}")
     # Granular Signal Enhancement settings
     if ENABLE_MAGNITUDE_TRACKING or ENABLE_MULTI_EXCHANGE:
-        log.info("-" * 40)
+        log.info(_SEP40)
         log.info("Granular Signals: ENABLED")
         if ENABLE_MAGNITUDE_TRACKING:
             log.info(f"  - Magnitude: min cumulative {MIN_CUMULATIVE_MAGNITUDE*100:.1f}%, "
@@ -1935,13 +2801,22 @@ def run_bot():
             log.info(f"  - Multi-Exchange: DISABLED")
         log.info(f"  - Shadow Logging: {'ENABLED' if ENABLE_GRANULAR_SHADOW_LOG else 'DISABLED'}")
     else:
-        log.info("-" * 40)
+        log.info(_SEP40)
         log.info("Granular Signals: DISABLED")
-    log.info("=" * 60)
+    log.info(_SEP60)
+
+    # Fail fast on missing credentials
+    missing = CONFIG.missing()
+    if missing:
+        log.error(f"{', '.join(missing)} not set. Exiting.")
+        return
 
     # Initialize state
     state = BotState()
     state.load()
+    # Debounced changes must reach disk on exit; SIGTERM exits through atexit too
+    atexit.register(state.flush)
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
 
     # Get initial balance
     balance = get_wallet_balance()
@@ -1952,7 +2827,7 @@ def run_bot():
             state.daily_start_balance = balance
         if balance > state.peak_balance:
             state.peak_balance = balance
-        state.save()
+        state.mark_dirty()
 
     log.info(f"Current Balance: ${state.current_balance:.2f}")
     log.info(f"Peak Balance: ${state.peak_balance:.2f}")
@@ -1966,6 +2841,13 @@ def run_bot():
 
     log.info("CLOB client initialized.")
 
+    # Start push-based fill tracking
+    global _fill_stream
+    if ENABLE_USER_WS_FILLS and not SHADOW_MODE:
+        _fill_stream = OrderFillStream(getattr(client, 'creds', None))
+        _fill_stream.start()
+        log.info(f"Order Fill Stream: {'ENABLED' if _fill_stream.enabled else 'DISABLED (aiohttp not installed)'}")
+
     # Initialize auto-redeemer
     redeemer = AutoRedeemer()
     log.info(f"Auto-Redeemer: {'ENABLED' if redeemer.enabled else 'DISABLED'}")
@@ -1973,7 +2855,6 @@ def run_bot():
     log.info("Starting main loop...")
 
     # Initialize Telegram with command polling
-    from telegram_handler import get_telegram_bot
     telegram = get_telegram_bot()
     telegram.start_polling()
 
@@ -1998,9 +2879,7 @@ def run_bot():
             ]
 
             # Resolve DB path relative to project root
-            import os
-            project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-            db_path = os.path.join(project_root, agent_config.SHADOW_DB_PATH)
+            db_path = str(PROJECT_ROOT.absolute() / agent_config.SHADOW_DB_PATH)
 
             orchestrator = SimulationOrchestrator(
                 strategies=shadow_configs,
@@ -2025,6 +2904,10 @@ def run_bot():
 
     try:
         while True:
+            # Pace scans from the loop start so fetch/trade time counts toward the interval
+            scan_deadline = time.monotonic() + SCAN_INTERVAL
+            state.flush_if_due()
+
             # Get current epoch
             epoch_start, time_in_epoch = get_current_epoch()
 
@@ -2034,12 +2917,14 @@ def run_bot():
                 redeemed, value = redeemer.check_and_redeem()
                 if redeemed > 0:
                     time.sleep(2)  # Wait for chain to settle
+                    invalidate_wallet_balance()
+                    invalidate_redeemable_value()
                     balance = get_wallet_balance()
                     if balance > 0:
                         state.current_balance = balance
                         if balance > state.peak_balance:
                             state.peak_balance = balance
-                        state.save()
+                        state.mark_dirty()
                         log.info(f"Balance updated after redemption: ${balance:.2f}")
 
                         # Auto-unhalt if redemption fixed the drawdown
@@ -2065,7 +2950,10 @@ def run_bot():
                 log.info(f"--- New Epoch: {epoch_time.strftime('%H:%M')} UTC ---")
 
                 # Resolve any completed positions from last epoch
-                resolve_completed_positions(state, orchestrator)
+                resolve_completed_positions(state, orchestrator, epoch_start)
+
+                # Make sure last epoch's signals and outcomes are on disk
+                flush_signals_db()
 
                 # Update balance at epoch start
                 balance = get_wallet_balance()
@@ -2073,27 +2961,27 @@ def run_bot():
                     state.current_balance = balance
                     if balance > state.peak_balance:
                         state.peak_balance = balance
-                    state.save()
+                    state.mark_dirty()
 
                 # Record epoch start prices for confluence detection (multi-exchange)
                 if ENABLE_MULTI_EXCHANGE:
-                    for crypto in CRYPTOS:
-                        prices = fetch_multi_exchange_prices(crypto)
+                    # All cryptos at once - each fetch already hits its 3 exchanges in parallel
+                    start_prices = _scan_executor.map(fetch_multi_exchange_prices, CRYPTOS)
+                    for crypto, prices in zip(CRYPTOS, start_prices):
                         if prices:
                             record_epoch_start_prices(crypto, epoch_start, prices)
-                            log.debug(f"{crypto}: Recorded epoch start prices from {len(prices)} exchanges")
+                            log.debug("%s: Recorded epoch start prices from %d exchanges", crypto, len(prices))
 
             # Only trade during window
             if time_in_epoch < TRADING_WINDOW_START:
-                mins_left = (TRADING_WINDOW_START - time_in_epoch) // 60
-                secs_left = (TRADING_WINDOW_START - time_in_epoch) % 60
-                log.debug(f"Waiting for trading window ({mins_left}m {secs_left}s)")
-                time.sleep(SCAN_INTERVAL)
+                mins_left, secs_left = divmod(TRADING_WINDOW_START - time_in_epoch, 60)
+                log.debug("Waiting for trading window (%dm %ds)", mins_left, secs_left)
+                time.sleep(max(0.0, scan_deadline - time.monotonic()))
                 continue
 
             if time_in_epoch > TRADING_WINDOW_END:
                 log.debug("Trading window closed for this epoch")
-                time.sleep(SCAN_INTERVAL)
+                time.sleep(max(0.0, scan_deadline - time.monotonic()))
                 continue
 
             # Check risk limits
@@ -2102,12 +2990,15 @@ def run_bot():
                 time.sleep(60)
                 continue
 
+            # Fetch this scan's market data for all cryptos at once
+            market = prefetch_scan_data(CRYPTOS, epoch_start)
+
             # SHADOW TRADING: Broadcast market data to all shadow strategies
             if orchestrator:
                 try:
                     for crypto in CRYPTOS:
-                        # Fetch prices for shadow strategies
-                        shadow_prices = fetch_polymarket_prices(crypto, epoch_start)
+                        # Prices for shadow strategies
+                        shadow_prices = market[crypto]['prices']
                         if not shadow_prices:
                             continue
 
@@ -2133,6 +3024,7 @@ def run_bot():
 
             # Scan each crypto
             scan_results = []  # Track what happened with each crypto
+            pending_trades = []  # New-position orders, submitted together after the scan
 
             for crypto in CRYPTOS:
                 # Skip if already traded this epoch (but allow averaging same epoch)
@@ -2145,12 +3037,12 @@ def run_bot():
                     continue
 
                 # Check position limit (only for new positions)
-                if not has_existing_position and len(state.positions) >= MAX_POSITIONS:
+                if not has_existing_position and len(state.positions) + len(pending_trades) >= MAX_POSITIONS:
                     scan_results.append(f"{crypto}:max_pos")
                     continue
 
-                # Fetch minute candles (now returns dicts with magnitude data)
-                candles = fetch_minute_candles(crypto, epoch_start)
+                # Minute candles (dicts with magnitude data)
+                candles = market[crypto]['candles']
                 if not candles:
                     scan_results.append(f"{crypto}:no_data")
                     continue
@@ -2161,12 +3053,16 @@ def run_bot():
                     scan_results.append(f"{crypto}:no_data")
                     continue
 
+                # Per-direction move size, reused by every logging path below
+                mags = _magnitude_by_direction(candles)
+
                 # Analyze pattern (pass candles for magnitude enhancement)
-                direction, accuracy, reason = analyze_pattern(minutes, candles)
+                minutes_mask = _pack_minutes(minutes)
+                direction, accuracy, reason = analyze_pattern(minutes, candles, minutes_mask)
 
                 # Skip weak patterns
                 if not direction or accuracy < MIN_PATTERN_ACCURACY:
-                    ups = sum(1 for m in minutes if m == 'Up')
+                    ups = minutes_mask.bit_count()
                     downs = len(minutes) - ups
                     scan_results.append(f"{crypto}:{ups}↑{downs}↓(weak)")
                     # Log granular comparison even for weak patterns (for analysis)
@@ -2174,8 +3070,8 @@ def run_bot():
                         # Determine dominant direction for logging
                         weak_dir = "Up" if ups > downs else "Down" if downs > ups else None
                         if weak_dir:
-                            magnitude_boost = calculate_magnitude_boost(candles, weak_dir)
-                            magnitude_pct = sum(abs(c.get('change_pct', 0)) for c in candles if c.get('direction') == weak_dir)
+                            magnitude_pct = mags[weak_dir]
+                            magnitude_boost = _magnitude_boost_from_total(magnitude_pct / 100.0)
                             log_granular_comparison(
                                 crypto=crypto, epoch=epoch_start,
                                 pattern_direction=weak_dir, old_accuracy=accuracy, new_accuracy=accuracy,
@@ -2192,8 +3088,8 @@ def run_bot():
                             )
                     continue
 
-                # Fetch Polymarket prices
-                prices = fetch_polymarket_prices(crypto, epoch_start)
+                # Polymarket prices
+                prices = market[crypto]['prices']
                 if not prices:
                     scan_results.append(f"{crypto}:{direction}(no_prices)")
                     continue
@@ -2209,14 +3105,14 @@ def run_bot():
 
                     if not should_add:
                         scan_results.append(f"{crypto}:holding")
-                        log.debug(f"{crypto}: No averaging - {avg_reason}")
+                        log.debug("%s: No averaging - %s", crypto, avg_reason)
                         continue
 
                     # Averaging opportunity found!
                     scan_results.append(f"{crypto}:{direction}+ADD")
 
                     # Calculate additional position size (reduced to limit downside risk)
-                    existing_size = existing_pos['size']
+                    existing_size = existing_pos.size
                     base_add_size = calculate_position_size(state.current_balance, accuracy, existing_size)
                     # Apply averaging multiplier - only add 50% of normal to reduce exposure on potential losing trades
                     add_size = base_add_size * AVERAGING_SIZE_MULTIPLIER
@@ -2227,15 +3123,18 @@ def run_bot():
                         continue
 
                     # Log the averaging signal
-                    log.info(f"")
-                    log.info(f"{'='*50}")
-                    log.info(f"AVERAGING: {crypto} {direction}")
-                    log.info(f"  {avg_reason}")
-                    log.info(f"  Original Entry: ${existing_pos['entry_price']:.2f}")
-                    log.info(f"  New Entry: ${entry_price:.2f}")
-                    log.info(f"  Existing Size: ${existing_size:.2f}")
-                    log.info(f"  Adding: ${add_size:.2f} (50% of ${base_add_size:.2f})")
-                    log.info(f"{'='*50}")
+                    if log.isEnabledFor(logging.INFO):
+                        log.info("\n".join((
+                            "",
+                            _SEP50,
+                            f"AVERAGING: {crypto} {direction}",
+                            f"  {avg_reason}",
+                            f"  Original Entry: ${existing_pos.entry_price:.2f}",
+                            f"  New Entry: ${entry_price:.2f}",
+                            f"  Existing Size: ${existing_size:.2f}",
+                            f"  Adding: ${add_size:.2f} (50% of ${base_add_size:.2f})",
+                            _SEP50,
+                        )))
 
                     # Place averaging trade
                     token_id = prices[direction]['token_id']
@@ -2247,26 +3146,26 @@ def run_bot():
                         new_cost = filled_size    # USD spent now
                         total_cost = old_cost + new_cost
 
-                        old_shares = existing_size / existing_pos['entry_price']
+                        old_shares = existing_size / existing_pos.entry_price
                         new_shares = filled_size / entry_price
                         total_shares = old_shares + new_shares
 
                         avg_entry = total_cost / total_shares
 
                         # Update position
-                        state.positions[crypto] = {
-                            'direction': direction,
-                            'entry_price': avg_entry,  # Weighted average
-                            'size': total_cost,        # Total USD invested
-                            'epoch': existing_pos['epoch'],  # Keep original epoch
-                            'accuracy': accuracy,
-                            'adds': existing_pos.get('adds', 0) + 1
-                        }
+                        state.positions[crypto] = Position(
+                            direction=direction,
+                            entry_price=avg_entry,      # Weighted average
+                            size=total_cost,            # Total USD invested
+                            epoch=existing_pos.epoch,   # Keep original epoch
+                            accuracy=accuracy,
+                            adds=existing_pos.adds + 1
+                        )
                         state.last_epoch_traded[crypto] = epoch_start
                         state.total_trades += 1
-                        state.save()
+                        state.mark_dirty()
 
-                        log.info(f"Position AVERAGED: ${total_cost:.2f} @ ${avg_entry:.2f} (was ${existing_pos['entry_price']:.2f})")
+                        log.info(f"Position AVERAGED: ${total_cost:.2f} @ ${avg_entry:.2f} (was ${existing_pos.entry_price:.2f})")
                         notify_trade(
                             crypto, direction, entry_price, filled_size,
                             accuracy=accuracy, magnitude_boost=0.0,
@@ -2279,23 +3178,28 @@ def run_bot():
 
                 # New position logic (no existing position)
 
+                # Magnitude figures for logging (same for every outcome below)
+                magnitude_pct = mags[direction]
+                magnitude_boost = _magnitude_boost_from_total(magnitude_pct / 100.0)
+                old_accuracy = accuracy - magnitude_boost  # Original accuracy without boost
+
                 # Check exchange confluence before placing trade
                 confluence_dir: Optional[str] = None
                 agree_count: int = 0
                 avg_change: float = 0.0
 
                 if ENABLE_MULTI_EXCHANGE:
-                    confluence_dir, agree_count, avg_change = get_exchange_confluence(crypto, epoch_start)
+                    confluence_dir, agree_count, avg_change = get_exchange_confluence(
+                        crypto, epoch_start, current_prices=market[crypto]['exchange_prices']
+                    )
                     if confluence_dir is not None:
                         if confluence_dir == direction:
-                            log.info(f"Confluence: {agree_count}/3 exchanges agree {direction} ({avg_change:+.2f}%)")
+                            log.info("Confluence: %d/3 exchanges agree %s (%+.2f%%)", agree_count, direction, avg_change)
                         else:
-                            log.info(f"SKIP: Pattern={direction} but confluence={confluence_dir} ({agree_count}/3 exchanges, {avg_change:+.2f}%)")
+                            log.info("SKIP: Pattern=%s but confluence=%s (%d/3 exchanges, %+.2f%%)",
+                                     direction, confluence_dir, agree_count, avg_change)
                             scan_results.append(f"{crypto}:{direction}(conf_mismatch)")
                             # Log granular comparison even for skipped trades
-                            magnitude_boost = calculate_magnitude_boost(candles, direction) if candles else 0.0
-                            magnitude_pct = sum(abs(c.get('change_pct', 0)) for c in candles if c.get('direction') == direction) if candles else 0.0
-                            old_accuracy = accuracy - magnitude_boost  # Original accuracy without boost
                             log_granular_comparison(
                                 crypto=crypto, epoch=epoch_start,
                                 pattern_direction=direction, old_accuracy=old_accuracy, new_accuracy=accuracy,
@@ -2313,12 +3217,10 @@ def run_bot():
                             continue
                     else:
                         # No consensus = choppy market, BLOCK the trade
-                        log.info(f"SKIP: No confluence - only {agree_count}/3 exchanges agree ({avg_change:+.2f}%) - market too choppy")
+                        log.info("SKIP: No confluence - only %d/3 exchanges agree (%+.2f%%) - market too choppy",
+                                 agree_count, avg_change)
                         scan_results.append(f"{crypto}:{direction}(no_conf)")
                         # Log granular comparison even for skipped trades
-                        magnitude_boost = calculate_magnitude_boost(candles, direction) if candles else 0.0
-                        magnitude_pct = sum(abs(c.get('change_pct', 0)) for c in candles if c.get('direction') == direction) if candles else 0.0
-                        old_accuracy = accuracy - magnitude_boost
                         log_granular_comparison(
                             crypto=crypto, epoch=epoch_start,
                             pattern_direction=direction, old_accuracy=old_accuracy, new_accuracy=accuracy,
@@ -2338,9 +3240,6 @@ def run_bot():
                 scan_results.append(f"{crypto}:{direction}({accuracy*100:.0f}%)")
 
                 # Log granular signal data for ALL patterns that pass initial checks
-                magnitude_boost = calculate_magnitude_boost(candles, direction) if candles else 0.0
-                magnitude_pct = sum(abs(c.get('change_pct', 0)) for c in candles if c.get('direction') == direction) if candles else 0.0
-                old_accuracy = accuracy - magnitude_boost
                 log_granular_comparison(
                     crypto=crypto, epoch=epoch_start,
                     pattern_direction=direction, old_accuracy=old_accuracy, new_accuracy=accuracy,
@@ -2352,7 +3251,8 @@ def run_bot():
                 max_entry = accuracy - EDGE_BUFFER  # e.g., 74% accuracy -> max $0.69 entry
                 max_entry = min(max_entry, MAX_ENTRY_PRICE_CAP)  # Apply hard cap
                 if entry_price > max_entry:
-                    log.info(f"{crypto}: {direction} ({accuracy*100:.0f}%) but entry ${entry_price:.2f} > ${max_entry:.2f} max (no edge)")
+                    log.info("%s: %s (%.0f%%) but entry $%.2f > $%.2f max (no edge)",
+                             crypto, direction, accuracy * 100, entry_price, max_entry)
                     # Log to database
                     log_signal_to_db(
                         crypto=crypto, epoch=epoch_start, direction=direction,
@@ -2371,7 +3271,7 @@ def run_bot():
                     continue
 
                 # Log the signal to database BEFORE placing trade
-                signal_id = log_signal_to_db(
+                log_signal_to_db(
                     crypto=crypto, epoch=epoch_start, direction=direction,
                     pattern_accuracy=old_accuracy, magnitude_pct=magnitude_pct, magnitude_boost=magnitude_boost,
                     confluence_direction=confluence_dir, confluence_count=agree_count, confluence_change=avg_change,
@@ -2380,31 +3280,52 @@ def run_bot():
                 )
 
                 # Log the signal
-                log.info(f"")
-                log.info(f"{'='*50}")
-                log.info(f"SIGNAL: {crypto} {direction}")
-                log.info(f"  Pattern: {reason}")
-                log.info(f"  Entry Price: ${entry_price:.2f}")
-                log.info(f"  Position Size: ${size:.2f}")
-                log.info(f"{'='*50}")
-
-                # Place trade and verify fill
-                token_id = prices[direction]['token_id']
-                success, filled_size = place_trade(client, crypto, direction, token_id, entry_price, size)
+                if log.isEnabledFor(logging.INFO):
+                    log.info("\n".join((
+                        "",
+                        _SEP50,
+                        f"SIGNAL: {crypto} {direction}",
+                        f"  Pattern: {reason}",
+                        f"  Entry Price: ${entry_price:.2f}",
+                        f"  Position Size: ${size:.2f}",
+                        _SEP50,
+                    )))
+
+                # Queue the trade - all new positions this scan are placed concurrently
+                pending_trades.append({
+                    'crypto': crypto, 'direction': direction,
+                    'token_id': prices[direction]['token_id'],
+                    'entry_price': entry_price, 'size': size, 'accuracy': accuracy,
+                    'magnitude_pct': magnitude_pct, 'magnitude_boost': magnitude_boost,
+                    'agree_count': agree_count
+                })
+
+            # Place queued trades and verify fills
+            fills = place_trades(client, [
+                (t['crypto'], t['direction'], t['token_id'], t['entry_price'], t['size'])
+                for t in pending_trades
+            ])
+            for trade, (success, filled_size) in zip(pending_trades, fills):
+                crypto = trade['crypto']
+                direction = trade['direction']
+                entry_price = trade['entry_price']
+                accuracy = trade['accuracy']
+                magnitude_pct = trade['magnitude_pct']
+                magnitude_boost = trade['magnitude_boost']
+                agree_count = trade['agree_count']
 
                 if success and filled_size > 0:
                     # Record position with ACTUAL filled size (not requested size)
-                    state.positions[crypto] = {
-                        'direction': direction,
-                        'entry_price': entry_price,
-                        'size': filled_size,  # Use actual filled amount
-                        'epoch': epoch_start,
-                        'accuracy': accuracy,
-                        'adds': 0  # Track averaging adds
-                    }
+                    state.positions[crypto] = Position(
+                        direction=direction,
+                        entry_price=entry_price,
+                        size=filled_size,  # Use actual filled amount
+                        epoch=epoch_start,
+                        accuracy=accuracy
+                    )
                     state.last_epoch_traded[crypto] = epoch_start
                     state.total_trades += 1
-                    state.save()
+                    state.mark_dirty()
 
                     # Log trade to database
                     log_trade_to_db(
@@ -2422,16 +3343,19 @@ def run_bot():
                 else:
                     log.warning(f"{crypto}: Order did not fill - no position recorded")
 
+            # Persist this scan's fills and averaging adds in one write
+            state.flush_if_due()
+
             # Log scan summary
-            mins_in = time_in_epoch // 60
-            secs_in = time_in_epoch % 60
-            log.info(f"[min {mins_in}:{secs_in:02d}] Scan: {' | '.join(scan_results)}")
+            mins_in, secs_in = divmod(time_in_epoch, 60)
+            log.info("[min %d:%02d] Scan: %s", mins_in, secs_in, " | ".join(scan_results))
 
-            time.sleep(SCAN_INTERVAL)
+            time.sleep(max(0.0, scan_deadline - time.monotonic()))
 
     except KeyboardInterrupt:
         log.info("\nBot stopped by user")
         state.save()
+        close_signals_db()
 
     except Exception as e:
         log.error(f"Unexpected error: {e}")
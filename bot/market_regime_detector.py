@@ -5,21 +5,61 @@ Analyzes price data to classify market regime (bull, bear, volatile, sideways)
 and recommends adaptive trading parameters
 """
 
-import requests
+import json
 from collections import deque
-from typing import Dict, Optional
-import statistics
-
-CRYPTOS = ['btc', 'eth', 'sol', 'xrp']
-
-# Price API endpoints
-PRICE_APIS = {
-    'binance': {
-        'btc': 'https://api.binance.com/api/v3/ticker/price?symbol=BTCUSDT',
-        'eth': 'https://api.binance.com/api/v3/ticker/price?symbol=ETHUSDT',
-        'sol': 'https://api.binance.com/api/v3/ticker/price?symbol=SOLUSDT',
-        'xrp': 'https://api.binance.com/api/v3/ticker/price?symbol=XRPUSDT',
-    }
+from typing import Dict, Optional, Tuple
+
+CRYPTOS = ('btc', 'eth', 'sol', 'xrp')
+
+# Price API endpoint - one request returns every symbol listed in `symbols`
+BINANCE_TICKER_URL = 'https://api.binance.com/api/v3/ticker/price'
+BINANCE_SYMBOLS = {f'{crypto.upper()}USDT': crypto for crypto in CRYPTOS}
+_TICKER_PARAMS = {'symbols': json.dumps(list(BINANCE_SYMBOLS), separators=(',', ':'))}
+
+# Shared keep-alive session so repeated samples skip the TCP/TLS handshake
+try:
+    from http_session import SESSION, json_loads
+except ImportError:
+    from bot.http_session import SESSION, json_loads
+
+# Parameter overrides per regime (keys are momentum_bot_v12.py settings)
+_REGIME_PARAMS: Dict[str, Dict[str, object]] = {
+    # Strong uptrend - favor momentum following
+    'bull_momentum': {
+        'CONTRARIAN_ENABLED': False,           # Don't fade in trends!
+        'MIN_SIGNAL_STRENGTH': 0.60,           # Lower threshold for momentum
+        'EARLY_MAX_ENTRY': 0.35,               # Allow slightly higher entries
+        'CONTRARIAN_MAX_ENTRY': 0.10,          # Very cheap contrarian only
+        'MIN_TREND_SCORE': 0.20,               # Allow easier trend detection
+        'strategy_focus': 'momentum_following'
+    },
+    # Strong downtrend - favor momentum following
+    'bear_momentum': {
+        'CONTRARIAN_ENABLED': False,           # Don't fade in trends!
+        'MIN_SIGNAL_STRENGTH': 0.60,
+        'EARLY_MAX_ENTRY': 0.35,
+        'CONTRARIAN_MAX_ENTRY': 0.10,
+        'MIN_TREND_SCORE': 0.20,
+        'strategy_focus': 'momentum_following'
+    },
+    # High volatility - very conservative
+    'volatile': {
+        'CONTRARIAN_ENABLED': False,           # Too risky in volatility
+        'MIN_SIGNAL_STRENGTH': 0.80,           # Much stronger signals
+        'EARLY_MAX_ENTRY': 0.20,               # Only very cheap entries
+        'CONTRARIAN_MAX_ENTRY': 0.10,
+        'MAX_POSITION_USD': 10,                # Smaller positions
+        'strategy_focus': 'ultra_conservative'
+    },
+    # Range-bound - contrarian can work
+    'sideways': {
+        'CONTRARIAN_ENABLED': True,            # Fade extremes
+        'MIN_SIGNAL_STRENGTH': 0.65,           # Standard threshold
+        'EARLY_MAX_ENTRY': 0.30,               # Standard entries
+        'CONTRARIAN_MAX_ENTRY': 0.20,          # Good contrarian entries
+        'CONTRARIAN_PRICE_THRESHOLD': 0.70,    # Standard extreme
+        'strategy_focus': 'mean_reversion'
+    },
 }
 
 class MarketRegimeDetector:
@@ -31,33 +71,79 @@ class MarketRegimeDetector:
             crypto: deque(maxlen=lookback_windows)
             for crypto in CRYPTOS
         }
+        # Returns between consecutive prices in the window, with running
+        # Welford stats [count, mean, m2, positive_count] kept in step
+        self._returns: Dict[str, deque] = {
+            crypto: deque(maxlen=max(lookback_windows - 1, 0))
+            for crypto in CRYPTOS
+        }
+        self._stats: Dict[str, list] = {crypto: [0, 0.0, 0.0, 0] for crypto in CRYPTOS}
+        # Last detect_regime() result, keyed by the update count it was computed at
+        self._updates = 0
+        self._regime_cache: Optional[Tuple[int, dict]] = None
 
     def update_prices(self, crypto: str, price: float):
-        """Add new price data point."""
-        if crypto in self.price_history:
-            self.price_history[crypto].append(price)
+        """Add new price data point and update the rolling return stats."""
+        history = self.price_history.get(crypto)
+        if history is None:
+            return  # Not a tracked crypto
+
+        if history:
+            prev = history[-1]
+            r = (price - prev) / prev
+            returns = self._returns[crypto]
+            stats = self._stats[crypto]
+            if returns and len(returns) == returns.maxlen:
+                self._remove_return(stats, returns[0])
+            returns.append(r)
+            self._add_return(stats, r)
+        history.append(price)
+        self._updates += 1
+
+    @staticmethod
+    def _add_return(stats: list, r: float):
+        """Welford add step."""
+        count = stats[0] + 1
+        mean = stats[1]
+        delta = r - mean
+        mean += delta / count
+        stats[0] = count
+        stats[1] = mean
+        stats[2] += delta * (r - mean)
+        if r > 0:
+            stats[3] += 1
+
+    @staticmethod
+    def _remove_return(stats: list, r: float):
+        """Welford inverse step for the return leaving the window."""
+        count = stats[0] - 1
+        if count == 0:
+            stats[:] = [0, 0.0, 0.0, 0]
+            return
+        mean = stats[1]
+        new_mean = (mean * stats[0] - r) / count
+        stats[0] = count
+        stats[1] = new_mean
+        stats[2] = max(stats[2] - (r - mean) * (r - new_mean), 0.0)
+        if r > 0:
+            stats[3] -= 1
 
     def calculate_trend(self, crypto: str) -> dict:
         """Calculate trend metrics for a crypto."""
-        prices = list(self.price_history[crypto])
-
-        if len(prices) < 3:
+        if len(self.price_history[crypto]) < 3:
             return {'trend': 'unknown', 'strength': 0, 'volatility': 0}
 
-        # Calculate returns
-        returns = [(prices[i] - prices[i-1]) / prices[i-1]
-                   for i in range(1, len(prices))]
+        # Rolling stats are maintained by update_prices()
+        count, mean_return, m2, positive_returns = self._stats[crypto]
 
         # Trend direction
-        mean_return = statistics.mean(returns)
         trend = 'bullish' if mean_return > 0.001 else ('bearish' if mean_return < -0.001 else 'sideways')
 
         # Trend strength (how consistent the direction is)
-        positive_returns = sum(1 for r in returns if r > 0)
-        strength = abs(positive_returns / len(returns) - 0.5) * 2  # 0-1 scale
+        strength = abs(positive_returns / count - 0.5) * 2  # 0-1 scale
 
         # Volatility (std dev of returns)
-        volatility = statistics.stdev(returns) if len(returns) > 1 else 0
+        volatility = (m2 / (count - 1)) ** 0.5 if count > 1 else 0
 
         return {
             'trend': trend,
@@ -76,23 +162,29 @@ class MarketRegimeDetector:
                 - confidence: 0-1
                 - volatility: average volatility
                 - crypto_details: dict of per-crypto analysis
+
+            The result is cached until the next update_prices() call.
         """
+        cache = self._regime_cache
+        if cache is not None and cache[0] == self._updates:
+            return cache[1]
+
         crypto_analysis = {}
 
+        # Analyze each crypto and aggregate trends in the same pass
+        bullish_count = bearish_count = 0
+        total_strength = total_volatility = 0.0
         for crypto in CRYPTOS:
-            crypto_analysis[crypto] = self.calculate_trend(crypto)
-
-        # Aggregate trends
-        trends = [a['trend'] for a in crypto_analysis.values()]
-        strengths = [a['strength'] for a in crypto_analysis.values()]
-        volatilities = [a['volatility'] for a in crypto_analysis.values()]
+            analysis = self.calculate_trend(crypto)
+            crypto_analysis[crypto] = analysis
+            trend = analysis['trend']
+            bullish_count += trend == 'bullish'
+            bearish_count += trend == 'bearish'
+            total_strength += analysis['strength']
+            total_volatility += analysis['volatility']
 
-        avg_strength = statistics.mean(strengths) if strengths else 0
-        avg_volatility = statistics.mean(volatilities) if volatilities else 0
-
-        # Count trend directions
-        bullish_count = sum(1 for t in trends if t == 'bullish')
-        bearish_count = sum(1 for t in trends if t == 'bearish')
+        avg_strength = total_strength / len(CRYPTOS)
+        avg_volatility = total_volatility / len(CRYPTOS)
 
         # Determine regime
         if avg_volatility > 0.015:  # High volatility
@@ -108,12 +200,14 @@ class MarketRegimeDetector:
             regime = 'sideways'
             confidence = 1.0 - avg_strength  # High confidence when low directional strength
 
-        return {
+        result = {
             'regime': regime,
             'confidence': confidence,
             'volatility': avg_volatility,
             'crypto_details': crypto_analysis
         }
+        self._regime_cache = (self._updates, result)
+        return result
 
     def recommend_parameters(self, regime_data: dict) -> dict:
         """
@@ -121,72 +215,22 @@ class MarketRegimeDetector:
 
         Returns dict of parameter overrides for momentum_bot_v12.py
         """
-        regime = regime_data['regime']
-        volatility = regime_data['volatility']
-
-        # Base parameters (defaults from bot)
-        params = {}
-
-        if regime == 'bull_momentum':
-            # Strong uptrend - favor momentum following
-            params.update({
-                'CONTRARIAN_ENABLED': False,           # Don't fade in trends!
-                'MIN_SIGNAL_STRENGTH': 0.60,           # Lower threshold for momentum
-                'EARLY_MAX_ENTRY': 0.35,               # Allow slightly higher entries
-                'CONTRARIAN_MAX_ENTRY': 0.10,          # Very cheap contrarian only
-                'MIN_TREND_SCORE': 0.20,               # Allow easier trend detection
-                'strategy_focus': 'momentum_following'
-            })
-
-        elif regime == 'bear_momentum':
-            # Strong downtrend - favor momentum following
-            params.update({
-                'CONTRARIAN_ENABLED': False,           # Don't fade in trends!
-                'MIN_SIGNAL_STRENGTH': 0.60,
-                'EARLY_MAX_ENTRY': 0.35,
-                'CONTRARIAN_MAX_ENTRY': 0.10,
-                'MIN_TREND_SCORE': 0.20,
-                'strategy_focus': 'momentum_following'
-            })
-
-        elif regime == 'volatile':
-            # High volatility - very conservative
-            params.update({
-                'CONTRARIAN_ENABLED': False,           # Too risky in volatility
-                'MIN_SIGNAL_STRENGTH': 0.80,           # Much stronger signals
-                'EARLY_MAX_ENTRY': 0.20,               # Only very cheap entries
-                'CONTRARIAN_MAX_ENTRY': 0.10,
-                'MAX_POSITION_USD': 10,                # Smaller positions
-                'strategy_focus': 'ultra_conservative'
-            })
-
-        elif regime == 'sideways':
-            # Range-bound - contrarian can work
-            params.update({
-                'CONTRARIAN_ENABLED': True,            # Fade extremes
-                'MIN_SIGNAL_STRENGTH': 0.65,           # Standard threshold
-                'EARLY_MAX_ENTRY': 0.30,               # Standard entries
-                'CONTRARIAN_MAX_ENTRY': 0.20,          # Good contrarian entries
-                'CONTRARIAN_PRICE_THRESHOLD': 0.70,    # Standard extreme
-                'strategy_focus': 'mean_reversion'
-            })
-
-        return params
+        return dict(_REGIME_PARAMS.get(regime_data['regime'], {}))
 
 
 def get_current_prices() -> Dict[str, float]:
-    """Fetch current prices from Binance."""
+    """Fetch current prices from Binance (all tickers in one request)."""
     prices = {}
 
-    for crypto, url in PRICE_APIS['binance'].items():
-        try:
-            resp = requests.get(url, timeout=5)
-            if resp.status_code == 200:
-                data = resp.json()
-                prices[crypto] = float(data['price'])
-        except Exception as e:
-            print(f"Error fetching {crypto}: {e}")
-            continue
+    try:
+        resp = SESSION.get(BINANCE_TICKER_URL, params=_TICKER_PARAMS, timeout=5)
+        if resp.status_code == 200:
+            for ticker in json_loads(resp.content):
+                crypto = BINANCE_SYMBOLS.get(ticker['symbol'])
+                if crypto:
+                    prices[crypto] = float(ticker['price'])
+    except Exception as e:
+        print(f"Error fetching prices: {e}")
 
     return prices
 
@@ -35,20 +35,26 @@ RETAINED:
 - All 4 cryptos (BTC, ETH, SOL, XRP)
 """
 
-import requests
+import bisect
 import time
 import logging
 import json
 import os
 import sys
+from collections import deque
 from datetime import datetime, timezone
 from dataclasses import dataclass, asdict, field
 from typing import Optional, Dict, List, Tuple
-from collections import deque
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import Future, ThreadPoolExecutor, wait as futures_wait
 from pathlib import Path
 from dotenv import load_dotenv
 
+# Shared pooled HTTP session (keep-alive across exchange/Polymarket polls)
+try:
+    from http_session import SESSION, json_loads
+except ImportError:
+    from bot.http_session import SESSION, json_loads
+
 # Agent system imports (defer warning until logger is initialized)
 AGENT_SYSTEM_AVAILABLE = False
 try:
@@ -267,6 +273,13 @@ POSITION_TIERS = [
     (150, 0.07),    # Balance $75-150: max 7% per trade
     (float('inf'), 0.05),  # Balance > $150: max 5% per trade
 ]
+# Tier lookup tables (sorted by threshold) for a bisect in calculate_position_size
+_TIER_THRESHOLDS = tuple(threshold for threshold, _ in sorted(POSITION_TIERS))
+_TIER_PCTS = tuple(pct for _, pct in sorted(POSITION_TIERS))
+
+# Size multiplier by consecutive losses (capped at the last entry): no reduction
+# after 1 loss (normal variance), then 80% / 65% / 50% after 2 / 3 / 4+ losses
+_LOSS_STREAK_MULTIPLIERS = (1.0, 1.0, 0.80, 0.65, 0.50)
 MAX_POSITION_USD = 15               # Absolute max regardless of balance
 MIN_BET_USD = 1.10                  # Minimum CLOB order value
 MIN_SHARES = 5                      # Minimum shares required by CLOB
@@ -334,7 +347,6 @@ MIN_SIGNAL_STRENGTH = 0.65          # v12.1: Lowered to catch contrarian opportu
 RSI_PERIOD = 14
 RSI_OVERBOUGHT = 70
 RSI_OVERSOLD = 30
-RSI_HISTORY_SIZE = 50
 
 # Strategy: Early Momentum - USE CONFIG VALUES
 EARLY_MIN_ENTRY = 0.12              # v12: Slightly up from 0.10 - avoid extreme illiquidity
@@ -430,6 +442,19 @@ EXCHANGE_SYMBOLS = {
     "xrp": {"binance": "XRPUSDT", "kraken": "XRPUSD", "coinbase": "XRP-USD"},
 }
 
+PRICE_FETCH_TIMEOUT = 3  # Seconds to wait on exchange price fetches per update
+
+# Ticker URLs per crypto and exchange, formatted once at import
+EXCHANGE_URL_TEMPLATES = {
+    "binance": "https://api.binance.com/api/v3/ticker/price?symbol={sym}",
+    "kraken": "https://api.kraken.com/0/public/Ticker?pair={sym}",
+    "coinbase": "https://api.coinbase.com/v2/prices/{sym}/spot",
+}
+EXCHANGE_URLS = {
+    crypto: {ex: EXCHANGE_URL_TEMPLATES[ex].format(sym=sym) for ex, sym in symbols.items()}
+    for crypto, symbols in EXCHANGE_SYMBOLS.items()
+}
+
 # State directory
 STATE_DIR = "./v12_state"
 
@@ -527,7 +552,7 @@ _has_bull_overrides = check_bull_market_overrides()
 # DATA CLASSES
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class TradingState:
     """Persistent trading state."""
     day_start_balance: float = 0.0
@@ -547,7 +572,7 @@ class TradingState:
     daily_loss_count: int = 0       # Number of losses today
 
 
-@dataclass
+@dataclass(slots=True)
 class TradeRecord:
     """Record of a single trade."""
     timestamp: float
@@ -565,7 +590,7 @@ class TradeRecord:
     payout: Optional[float] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Position:
     """Open position with stop-loss tracking."""
     crypto: str
@@ -584,33 +609,44 @@ class Position:
 # =============================================================================
 
 class RSICalculator:
-    """Calculate RSI for each crypto."""
+    """Calculate RSI for each crypto (Wilder's smoothing, O(1) per price)."""
 
     def __init__(self, period: int = RSI_PERIOD):
         self.period = period
-        self.price_history: Dict[str, deque] = {
-            crypto: deque(maxlen=RSI_HISTORY_SIZE) for crypto in CRYPTOS
-        }
         self.rsi_values: Dict[str, float] = {crypto: 50.0 for crypto in CRYPTOS}
+        # Wilder state: averages are plain sums until `period` changes have been seen
+        self._last_price: Dict[str, float] = {}
+        self._avg_gain: Dict[str, float] = {crypto: 0.0 for crypto in CRYPTOS}
+        self._avg_loss: Dict[str, float] = {crypto: 0.0 for crypto in CRYPTOS}
+        self._count: Dict[str, int] = {crypto: 0 for crypto in CRYPTOS}
 
     def add_price(self, crypto: str, price: float, timestamp: float):
-        self.price_history[crypto].append((timestamp, price))
-        self._calculate_rsi(crypto)
-
-    def _calculate_rsi(self, crypto: str):
-        prices = [p[1] for p in self.price_history[crypto]]
-        if len(prices) < self.period + 1:
+        last_price = self._last_price.get(crypto)
+        self._last_price[crypto] = price
+        if last_price is None:
             return
 
-        changes = [prices[i] - prices[i-1] for i in range(1, len(prices))]
-        gains = [c if c > 0 else 0 for c in changes]
-        losses = [-c if c < 0 else 0 for c in changes]
-
-        recent_gains = gains[-self.period:]
-        recent_losses = losses[-self.period:]
-
-        avg_gain = sum(recent_gains) / self.period
-        avg_loss = sum(recent_losses) / self.period
+        delta = price - last_price
+        gain = delta if delta > 0 else 0.0
+        loss = -delta if delta < 0 else 0.0
+        period = self.period
+        count = self._count[crypto] + 1
+        self._count[crypto] = count
+
+        if count < period:
+            # Warm-up: accumulate the seed sums
+            self._avg_gain[crypto] += gain
+            self._avg_loss[crypto] += loss
+            return
+        if count == period:
+            # Seed with the simple average of the first `period` changes
+            avg_gain = (self._avg_gain[crypto] + gain) / period
+            avg_loss = (self._avg_loss[crypto] + loss) / period
+        else:
+            avg_gain = (self._avg_gain[crypto] * (period - 1) + gain) / period
+            avg_loss = (self._avg_loss[crypto] * (period - 1) + loss) / period
+        self._avg_gain[crypto] = avg_gain
+        self._avg_loss[crypto] = avg_loss
 
         if avg_loss == 0:
             self.rsi_values[crypto] = 100.0
@@ -685,7 +721,7 @@ class Guardian:
     def get_open_positions_value(self) -> float:
         """Get current value of all open positions."""
         try:
-            resp = requests.get(
+            resp = SESSION.get(
                 "https://data-api.polymarket.com/positions",
                 params={"user": EOA, "limit": 20},
                 timeout=10
@@ -693,7 +729,7 @@ class Guardian:
             if resp.status_code != 200:
                 return 0
 
-            positions = resp.json()
+            positions = json_loads(resp.content)
             total_value = 0
             for pos in positions:
                 size = float(pos.get('size', 0))
@@ -707,7 +743,7 @@ class Guardian:
     def get_redeemable_value(self) -> float:
         """Get value of winning positions pending redemption."""
         try:
-            resp = requests.get(
+            resp = SESSION.get(
                 "https://data-api.polymarket.com/positions",
                 params={"user": EOA, "limit": 50},
                 timeout=10
@@ -715,7 +751,7 @@ class Guardian:
             if resp.status_code != 200:
                 return 0
 
-            positions = resp.json()
+            positions = json_loads(resp.content)
             redeemable_value = 0
             for pos in positions:
                 size = float(pos.get('size', 0))
@@ -767,12 +803,9 @@ class Guardian:
         """
         balance = self.state.current_balance
 
-        # Get tier-appropriate max percentage
-        max_pct = 0.05  # Default fallback
-        for threshold, pct in POSITION_TIERS:
-            if balance < threshold:
-                max_pct = pct
-                break
+        # Get tier-appropriate max percentage (first tier whose threshold exceeds balance)
+        tier = bisect.bisect_right(_TIER_THRESHOLDS, balance)
+        max_pct = _TIER_PCTS[tier] if tier < len(_TIER_PCTS) else 0.05  # Default fallback
 
         # Calculate base size from balance
         max_from_balance = balance * max_pct
@@ -782,13 +815,9 @@ class Guardian:
         base_size = max_from_balance * mode_multiplier
 
         # Adjust for consecutive losses (gentler reduction)
-        if self.state.consecutive_losses >= 4:
-            base_size *= 0.50  # 50% after 4 losses
-        elif self.state.consecutive_losses >= 3:
-            base_size *= 0.65  # 65% after 3 losses
-        elif self.state.consecutive_losses >= 2:
-            base_size *= 0.80  # 80% after 2 losses
-        # No reduction after 1 loss - normal variance
+        base_size *= _LOSS_STREAK_MULTIPLIERS[
+            min(max(self.state.consecutive_losses, 0), len(_LOSS_STREAK_MULTIPLIERS) - 1)
+        ]
 
         # Adjust for signal strength
         size = base_size * (0.7 + 0.3 * signal_strength)
@@ -849,7 +878,7 @@ class Guardian:
         Returns (has_conflict, conflict_message).
         """
         try:
-            resp = requests.get(
+            resp = SESSION.get(
                 "https://data-api.polymarket.com/positions",
                 params={"user": EOA, "limit": 50},
                 timeout=10
@@ -859,7 +888,7 @@ class Guardian:
                 log.warning(f"Failed to fetch live positions (status {resp.status_code})")
                 return False, ""  # Don't block on API failure
 
-            positions = resp.json()
+            positions = json_loads(resp.content)
             crypto_upper = crypto.upper()
 
             # Check each position for conflicts
@@ -997,11 +1026,11 @@ class StopLossManager:
     def _get_current_price(self, token_id: str) -> Optional[float]:
         """Get current bid price for a token (what we'd sell at)."""
         try:
-            resp = requests.get(
+            resp = SESSION.get(
                 f"https://clob.polymarket.com/book?token_id={token_id}",
                 timeout=3
             )
-            book = resp.json()
+            book = json_loads(resp.content)
             bids = book.get("bids", [])
             # Best bid is highest price (first in sorted list)
             return float(bids[0]["price"]) if bids else None
@@ -1019,6 +1048,7 @@ class StopLossManager:
                 side=SELL,
             )
             result = self.client.create_and_post_order(order_args)
+            invalidate_usdc_balance()
 
             if result and result.get("success"):
                 # Remove from guardian tracking
@@ -1258,19 +1288,20 @@ class MultiExchangePriceFeed:
         self.rsi = rsi_calculator
         self.epoch_starts: Dict[str, Dict[int, Dict[str, float]]] = {}
         self.current_prices: Dict[str, Dict[str, float]] = {}
-        self.price_stability: Dict[str, List[Tuple[float, float]]] = {c: [] for c in CRYPTOS}
+        # (timestamp, avg price) per crypto, oldest first; entries older than 180s are popped
+        self.price_stability: Dict[str, deque] = {c: deque() for c in CRYPTOS}
 
-    def get_binance_price(self, symbol: str) -> Optional[float]:
+    def get_binance_price(self, url: str) -> Optional[float]:
         try:
-            resp = requests.get(f"https://api.binance.com/api/v3/ticker/price?symbol={symbol}", timeout=2)
-            return float(resp.json()["price"])
+            resp = SESSION.get(url, timeout=2)
+            return float(json_loads(resp.content)["price"])
         except:
             return None
 
-    def get_kraken_price(self, symbol: str) -> Optional[float]:
+    def get_kraken_price(self, url: str) -> Optional[float]:
         try:
-            resp = requests.get(f"https://api.kraken.com/0/public/Ticker?pair={symbol}", timeout=2)
-            data = resp.json()
+            resp = SESSION.get(url, timeout=2)
+            data = json_loads(resp.content)
             if data.get("error"):
                 return None
             for key, val in data.get("result", {}).items():
@@ -1279,27 +1310,39 @@ class MultiExchangePriceFeed:
         except:
             return None
 
-    def get_coinbase_price(self, symbol: str) -> Optional[float]:
+    def get_coinbase_price(self, url: str) -> Optional[float]:
         try:
-            resp = requests.get(f"https://api.coinbase.com/v2/prices/{symbol}/spot", timeout=2)
-            return float(resp.json()["data"]["amount"])
+            resp = SESSION.get(url, timeout=2)
+            return float(json_loads(resp.content)["data"]["amount"])
         except:
             return None
 
+    def _submit_fetches(self, crypto: str) -> Dict[str, Future]:
+        """Start one price fetch per exchange for a crypto."""
+        urls = EXCHANGE_URLS.get(crypto, {})
+        return {
+            "binance": self.executor.submit(self.get_binance_price, urls.get("binance", "")),
+            "kraken": self.executor.submit(self.get_kraken_price, urls.get("kraken", "")),
+            "coinbase": self.executor.submit(self.get_coinbase_price, urls.get("coinbase", "")),
+        }
+
     def update_prices(self, crypto: str):
         """Update prices from all exchanges."""
-        symbols = EXCHANGE_SYMBOLS.get(crypto, {})
+        self._apply_prices(crypto, self._submit_fetches(crypto))
 
-        futures = {
-            "binance": self.executor.submit(self.get_binance_price, symbols.get("binance", "")),
-            "kraken": self.executor.submit(self.get_kraken_price, symbols.get("kraken", "")),
-            "coinbase": self.executor.submit(self.get_coinbase_price, symbols.get("coinbase", "")),
-        }
+    def update_all_prices(self, cryptos: List[str]):
+        """Update prices for several cryptos, with every exchange request in flight at once."""
+        pending = {crypto: self._submit_fetches(crypto) for crypto in cryptos}
+        # One shared deadline for the whole fan-out; exchanges still pending are skipped
+        futures_wait([f for futures in pending.values() for f in futures.values()], timeout=PRICE_FETCH_TIMEOUT)
+        for crypto, futures in pending.items():
+            self._apply_prices(crypto, futures, timeout=0)
 
+    def _apply_prices(self, crypto: str, futures: Dict[str, Future], timeout: float = PRICE_FETCH_TIMEOUT):
         prices = {}
         for exchange, future in futures.items():
             try:
-                price = future.result(timeout=3)
+                price = future.result(timeout=timeout)
                 if price:
                     prices[exchange] = price
             except:
@@ -1314,9 +1357,11 @@ class MultiExchangePriceFeed:
         self.rsi.add_price(crypto, avg_price, time.time())
 
         now = time.time()
-        self.price_stability[crypto].append((now, avg_price))
+        history = self.price_stability[crypto]
+        history.append((now, avg_price))
         cutoff = now - 180
-        self.price_stability[crypto] = [(t, p) for t, p in self.price_stability[crypto] if t > cutoff]
+        while history[0][0] <= cutoff:
+            history.popleft()
 
         epoch = self.get_current_epoch()
         if crypto not in self.epoch_starts:
@@ -1378,19 +1423,17 @@ class MultiExchangePriceFeed:
             return None, max(up_count, down_count), avg_change, signals
 
     def is_direction_stable(self, crypto: str, direction: str, seconds: int = LATE_STABILITY_PERIOD) -> bool:
-        history = self.price_stability.get(crypto, [])
-        if len(history) < 2:
+        history = self.price_stability.get(crypto)
+        if not history or len(history) < 2:
             return False
 
-        now = time.time()
-        cutoff = now - seconds
-        recent = [(t, p) for t, p in history if t > cutoff]
-
-        if len(recent) < 2:
+        # History is time-ordered: need at least two samples inside the window
+        cutoff = time.time() - seconds
+        if history[-2][0] <= cutoff:
             return False
 
-        first_price = recent[0][1]
-        last_price = recent[-1][1]
+        first_price = next(p for t, p in history if t > cutoff)
+        last_price = history[-1][1]
         change = (last_price - first_price) / first_price
 
         if direction == "Up":
@@ -1414,12 +1457,12 @@ class AutoRedeemer:
 
     def get_redeemable_positions(self) -> List[Dict]:
         try:
-            resp = requests.get(
+            resp = SESSION.get(
                 "https://data-api.polymarket.com/positions",
                 params={"user": EOA, "redeemable": "true", "limit": 20},
                 timeout=10
             )
-            return resp.json() if resp.status_code == 200 else []
+            return json_loads(resp.content) if resp.status_code == 200 else []
         except:
             return []
 
@@ -1443,6 +1486,7 @@ class AutoRedeemer:
             signed = self.account.sign_transaction(txn)
             tx_hash = self.w3.eth.send_raw_transaction(signed.raw_transaction)
             receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash, timeout=120)
+            invalidate_usdc_balance()
             return receipt.status == 1
         except Exception as e:
             log.error(f"Redemption error: {e}")
@@ -1549,21 +1593,24 @@ class FutureWindowTrader:
         slug = f"{crypto}-updown-15m-{epoch}"
 
         try:
-            resp = requests.get(f"https://gamma-api.polymarket.com/events?slug={slug}", timeout=3)
-            if resp.status_code != 200 or not resp.json():
+            resp = SESSION.get(f"https://gamma-api.polymarket.com/events?slug={slug}", timeout=3)
+            if resp.status_code != 200:
+                return None
+            events = json_loads(resp.content)
+            if not events:
                 return None
 
-            event = resp.json()[0]
+            event = events[0]
             markets = event.get("markets", [])
             if not markets:
                 return None
 
             cid = markets[0].get("conditionId")
-            clob = requests.get(f"https://clob.polymarket.com/markets/{cid}", timeout=3)
+            clob = SESSION.get(f"https://clob.polymarket.com/markets/{cid}", timeout=3)
             if clob.status_code != 200:
                 return None
 
-            data = clob.json()
+            data = json_loads(clob.content)
             if not data.get("accepting_orders"):
                 return None
 
@@ -1577,8 +1624,8 @@ class FutureWindowTrader:
                     continue
 
                 try:
-                    book_resp = requests.get(f"https://clob.polymarket.com/book?token_id={token_id}", timeout=2)
-                    book = book_resp.json()
+                    book_resp = SESSION.get(f"https://clob.polymarket.com/book?token_id={token_id}", timeout=2)
+                    book = json_loads(book_resp.content)
                     asks = book.get("asks", [])
                     best_ask = float(asks[-1]["price"]) if asks else 0.99
                     prices[outcome] = {"token_id": token_id, "ask": best_ask}
@@ -1745,21 +1792,24 @@ def get_current_market(crypto: str) -> Optional[Dict]:
         slug = f"{crypto}-updown-{suffix}-{epoch}"
 
         try:
-            resp = requests.get(f"https://gamma-api.polymarket.com/events?slug={slug}", timeout=5)
-            if resp.status_code != 200 or not resp.json():
+            resp = SESSION.get(f"https://gamma-api.polymarket.com/events?slug={slug}", timeout=5)
+            if resp.status_code != 200:
+                continue  # Try next timeframe
+            events = json_loads(resp.content)
+            if not events:
                 continue  # Try next timeframe
 
-            event = resp.json()[0]
+            event = events[0]
             markets = event.get("markets", [])
             if not markets:
                 continue
 
             cid = markets[0].get("conditionId")
-            clob = requests.get(f"https://clob.polymarket.com/markets/{cid}", timeout=5)
+            clob = SESSION.get(f"https://clob.polymarket.com/markets/{cid}", timeout=5)
             if clob.status_code != 200:
                 continue
 
-            data = clob.json()
+            data = json_loads(clob.content)
             if not data.get("accepting_orders"):
                 continue
 
@@ -1795,21 +1845,24 @@ def get_all_markets(crypto: str) -> List[Dict]:
         slug = f"{crypto}-updown-{suffix}-{epoch}"
 
         try:
-            resp = requests.get(f"https://gamma-api.polymarket.com/events?slug={slug}", timeout=5)
-            if resp.status_code != 200 or not resp.json():
+            resp = SESSION.get(f"https://gamma-api.polymarket.com/events?slug={slug}", timeout=5)
+            if resp.status_code != 200:
+                continue
+            events = json_loads(resp.content)
+            if not events:
                 continue
 
-            event = resp.json()[0]
+            event = events[0]
             event_markets = event.get("markets", [])
             if not event_markets:
                 continue
 
             cid = event_markets[0].get("conditionId")
-            clob = requests.get(f"https://clob.polymarket.com/markets/{cid}", timeout=5)
+            clob = SESSION.get(f"https://clob.polymarket.com/markets/{cid}", timeout=5)
             if clob.status_code != 200:
                 continue
 
-            data = clob.json()
+            data = json_loads(clob.content)
             if not data.get("accepting_orders"):
                 continue
 
@@ -1837,8 +1890,8 @@ def get_market_prices(tokens: List[Dict]) -> Dict[str, Dict]:
             continue
 
         try:
-            resp = requests.get(f"https://clob.polymarket.com/book?token_id={token_id}", timeout=3)
-            book = resp.json()
+            resp = SESSION.get(f"https://clob.polymarket.com/book?token_id={token_id}", timeout=3)
+            book = json_loads(resp.content)
             asks = book.get("asks", [])
             best_ask = float(asks[-1]["price"]) if asks else 0.99
             prices[outcome] = {"token_id": token_id, "ask": best_ask}
@@ -1860,6 +1913,8 @@ def place_order(client: ClobClient, token_id: str, size: float, price: float) ->
     except Exception as e:
         log.error(f"Order error: {e}")
         return None
+    finally:
+        invalidate_usdc_balance()
 
 
 # =============================================================================
@@ -1995,9 +2050,28 @@ def validate_and_fix_state(state: TradingState, actual_balance: float) -> Tradin
     return state
 
 
+# Last successful on-chain USDC read: (monotonic time, USD). Kill switch, daily
+# limit, mode update and portfolio value in one tick share it instead of each
+# paying an RPC round trip.
+BALANCE_CACHE_TTL = 1.5  # Seconds
+_usdc_balance_cache: Tuple[float, float] = (0.0, 0.0)
+
+
+def invalidate_usdc_balance():
+    """Force the next get_usdc_balance() call to hit the RPC (after orders/redemptions)."""
+    global _usdc_balance_cache
+    _usdc_balance_cache = (0.0, 0.0)
+
+
 def get_usdc_balance() -> float:
+    global _usdc_balance_cache
+
+    cached_at, cached_balance = _usdc_balance_cache
+    if cached_at and time.monotonic() - cached_at < BALANCE_CACHE_TTL:
+        return cached_balance
+
     try:
-        resp = requests.post(RPC_URL, json={
+        resp = SESSION.post(RPC_URL, json={
             'jsonrpc': '2.0',
             'method': 'eth_call',
             'params': [{
@@ -2006,8 +2080,10 @@ def get_usdc_balance() -> float:
             }, 'latest'],
             'id': 1
         }, timeout=5)
-        balance_hex = resp.json().get('result', '0x0')
-        return int(balance_hex, 16) / 1e6
+        balance_hex = json_loads(resp.content).get('result', '0x0')
+        balance = int(balance_hex, 16) / 1e6
+        _usdc_balance_cache = (time.monotonic(), balance)
+        return balance
     except:
         return 0
 
@@ -2236,6 +2312,8 @@ def run_bot():
     epoch_bet_placed: Dict[int, bool] = {}
 
     while True:
+        # Pace scans from the loop start so work time counts toward the interval
+        scan_deadline = time.monotonic() + SCAN_INTERVAL
         try:
             # SHADOW TRADING: Always broadcast market data (even when halted)
             # This ensures shadow strategies continue learning regardless of live bot status
@@ -2336,8 +2414,7 @@ def run_bot():
                     log.error(f"Alert traceback: {traceback.format_exc()}")
 
             # 5. UPDATE PRICES
-            for crypto in CRYPTOS:
-                price_feed.update_prices(crypto)
+            price_feed.update_all_prices(CRYPTOS)
 
             # 6. CHECK STOP-LOSSES (FIX #3) - DISABLED for binary markets
             # NOTE: Stop-loss is fundamentally wrong for binary outcome markets
@@ -3348,7 +3425,11 @@ def run_bot():
             save_state(state)
 
             # v11: Faster scan cycle for better latency
-            time.sleep(SCAN_INTERVAL)
+            sleep_for = scan_deadline - time.monotonic()
+            if sleep_for > 0:
+                time.sleep(sleep_for)
+            else:
+                log.warning(f"Scan overran interval by {-sleep_for:.2f}s")
 
         except KeyboardInterrupt:
             log.info("Shutting down...")
@@ -0,0 +1,187 @@
+"""
+Order Fill Stream for Polymarket AutoTrader
+
+Listens on the Polymarket CLOB user WebSocket channel and tracks fills per
+order ID, so the intra_epoch_bot can wait for a fill event instead of polling
+GET /order repeatedly.
+
+Usage:
+    from order_stream import OrderFillStream
+
+    stream = OrderFillStream(client.creds)
+    stream.start()
+    filled = stream.wait_for_fill(order_id, original_size, timeout=2.5)
+    if filled is None:
+        ...  # Stream not connected - fall back to REST polling
+"""
+
+import asyncio
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+# aiohttp is only needed for the live stream; without it the stream stays disabled
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+log = logging.getLogger(__name__)
+
+USER_WS_URL = "wss://ws-subscriptions-clob.polymarket.com/ws/user"
+PING_INTERVAL = 10          # Seconds between keep-alive PINGs (server drops idle sockets)
+RECONNECT_DELAY_MAX = 30    # Seconds, cap for reconnect backoff
+MAX_TRACKED_ORDERS = 256    # Oldest order fill records are dropped beyond this
+
+
+class OrderFillStream:
+    """
+    Background WebSocket listener for our own order fills.
+
+    Design principles:
+    - Non-blocking: The socket runs on its own thread and event loop
+    - Fail-safe: Callers get None while disconnected and fall back to REST
+    - Race-free: Fills that arrive before wait_for_fill() is called are kept
+    """
+
+    def __init__(self, creds: Any):
+        """
+        Args:
+            creds: py-clob-client ApiCreds (api_key, api_secret, api_passphrase)
+        """
+        self.enabled = aiohttp is not None and creds is not None
+        self._auth = {
+            "apiKey": getattr(creds, "api_key", ""),
+            "secret": getattr(creds, "api_secret", ""),
+            "passphrase": getattr(creds, "api_passphrase", ""),
+        }
+        self.connected = False
+
+        # order_id -> matched shares, guarded by _cond
+        self._matched: "OrderedDict[str, float]" = OrderedDict()
+        self._closed: set = set()
+        self._cond = threading.Condition()
+
+        self._running = False
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start the listener thread (no-op if disabled or already running)."""
+        if not self.enabled or self._running:
+            return
+        self._running = True
+        self._thread = threading.Thread(target=lambda: asyncio.run(self._run()), daemon=True)
+        self._thread.start()
+        log.info("Order fill stream started")
+
+    def stop(self) -> None:
+        """Stop the listener thread."""
+        self._running = False
+        if self._thread and self._thread.is_alive():
+            self._thread.join(timeout=5)
+
+    def wait_for_fill(self, order_id: str, original_size: float, timeout: float) -> Optional[float]:
+        """
+        Block until the order is (nearly) fully matched, closed, or timeout expires.
+
+        Args:
+            order_id: CLOB order ID returned by post_order
+            original_size: Order size in shares
+            timeout: Max seconds to wait
+
+        Returns:
+            Shares matched so far (capped at original_size), or None if the
+            stream is not connected
+        """
+        if not self.connected:
+            return None
+
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            while True:
+                matched = min(self._matched.get(order_id, 0.0), original_size)
+                if matched >= original_size * 0.99 or order_id in self._closed:
+                    return matched
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not self.connected:
+                    return matched
+                self._cond.wait(remaining)
+
+    # =========================================================================
+    # Internals
+    # =========================================================================
+
+    async def _run(self) -> None:
+        """Connect, subscribe and read events; reconnect with backoff on failure."""
+        delay = 1
+        while self._running:
+            try:
+                async with aiohttp.ClientSession() as session:
+                    async with session.ws_connect(USER_WS_URL, heartbeat=PING_INTERVAL) as ws:
+                        await ws.send_json({"auth": self._auth, "type": "user", "markets": []})
+                        self._set_connected(True)
+                        delay = 1
+                        async for msg in ws:
+                            if not self._running:
+                                break
+                            if msg.type == aiohttp.WSMsgType.TEXT:
+                                self._handle_message(msg.data)
+                            elif msg.type in (aiohttp.WSMsgType.CLOSED, aiohttp.WSMsgType.ERROR):
+                                break
+            except Exception as e:
+                log.debug(f"Order fill stream error: {e}")
+            finally:
+                self._set_connected(False)
+
+            if self._running:
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, RECONNECT_DELAY_MAX)
+
+    def _set_connected(self, connected: bool) -> None:
+        with self._cond:
+            self.connected = connected
+            self._cond.notify_all()
+
+    def _handle_message(self, raw: str) -> None:
+        """Apply one WebSocket text frame (a single event or a list of events)."""
+        try:
+            data = json.loads(raw)
+        except ValueError:
+            return  # PONG and other non-JSON frames
+
+        events = data if isinstance(data, list) else [data]
+        with self._cond:
+            for event in events:
+                if isinstance(event, dict):
+                    self._apply_event(event)
+            while len(self._matched) > MAX_TRACKED_ORDERS:
+                order_id, _ = self._matched.popitem(last=False)
+                self._closed.discard(order_id)
+            self._cond.notify_all()
+
+    def _apply_event(self, event: Dict[str, Any]) -> None:
+        """
+        Update matched size from an 'order' event (caller holds _cond).
+
+        Fills come from the order's cumulative size_matched only. 'trade' events
+        describe the same fills (re-sent per settlement status), so counting them
+        as well would double the matched size; they are ignored.
+        """
+        if event.get("event_type") != "order":
+            return
+
+        order_id = event.get("id")
+        if not order_id:
+            return
+        self._record(order_id, float(event.get("size_matched") or 0))
+        if event.get("type") == "CANCELLATION":
+            self._closed.add(order_id)
+
+    def _record(self, order_id: str, matched: float) -> None:
+        """Set matched size (never decreases, so stale out-of-order updates are ignored)."""
+        if matched >= self._matched.get(order_id, 0.0):
+            self._matched[order_id] = matched
+            self._matched.move_to_end(order_id)
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the intra-epoch multi-exchange price cache.
+
+Tests _cached_fetch_multi_exchange_prices with a stubbed exchange fetch.
+"""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# Bot modules use flat imports (bot/ on sys.path)
+sys.path.append(str(Path(__file__).parent.parent / "bot"))
+# The bot opens its log files at import; keep them out of the repo root
+os.environ.setdefault("INTRA_LOG_DIR", tempfile.mkdtemp(prefix="intra_epoch_logs_"))
+
+import pytest
+
+bot = pytest.importorskip("intra_epoch_bot", reason="bot dependencies not installed")
+
+PRICES = {"binance": 100.0, "kraken": 100.1, "coinbase": 99.9}
+
+
+class FakeClock:
+    """Stands in for time.monotonic(); the stubbed fetch advances it."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(bot.time, "monotonic", clock.monotonic)
+    monkeypatch.setattr(bot, "_price_cache", {})
+    return clock
+
+
+def stub_fetch(monkeypatch, clock, duration=0.0, prices=PRICES):
+    """Replace the exchange fetch with one that takes `duration` seconds."""
+    calls = []
+
+    def fetch(crypto, min_exchanges=None):
+        calls.append(crypto)
+        clock.now += duration
+        return dict(prices)
+
+    monkeypatch.setattr(bot, "fetch_multi_exchange_prices", fetch)
+    return calls
+
+
+class TestExchangePriceCache:
+    """Memoization of multi-exchange prices."""
+
+    def test_second_call_within_ttl_is_cached(self, clock, monkeypatch):
+        calls = stub_fetch(monkeypatch, clock)
+        assert bot._cached_fetch_multi_exchange_prices("BTC", ttl=1.0) == PRICES
+        clock.now += 0.5
+        assert bot._cached_fetch_multi_exchange_prices("BTC", ttl=1.0) == PRICES
+        assert calls == ["BTC"]
+
+    def test_entry_expires_after_ttl(self, clock, monkeypatch):
+        calls = stub_fetch(monkeypatch, clock)
+        bot._cached_fetch_multi_exchange_prices("BTC", ttl=1.0)
+        clock.now += 1.0
+        bot._cached_fetch_multi_exchange_prices("BTC", ttl=1.0)
+        assert calls == ["BTC", "BTC"]
+
+    def test_slow_fetch_stamped_when_it_returns(self, clock, monkeypatch):
+        # A fetch that runs past the TTL must still produce a usable entry
+        calls = stub_fetch(monkeypatch, clock, duration=1.5)
+        bot._cached_fetch_multi_exchange_prices("BTC", ttl=1.0)
+        assert bot._price_cache["BTC"][0] == clock.now
+        clock.now += 0.5
+        bot._cached_fetch_multi_exchange_prices("BTC", ttl=1.0)
+        assert calls == ["BTC"]
+
+    def test_empty_result_not_cached(self, clock, monkeypatch):
+        calls = stub_fetch(monkeypatch, clock, prices={})
+        assert bot._cached_fetch_multi_exchange_prices("BTC", ttl=1.0) == {}
+        bot._cached_fetch_multi_exchange_prices("BTC", ttl=1.0)
+        assert calls == ["BTC", "BTC"]
+        assert "BTC" not in bot._price_cache
+
+    def test_cryptos_cached_separately(self, clock, monkeypatch):
+        calls = stub_fetch(monkeypatch, clock)
+        bot._cached_fetch_multi_exchange_prices("BTC", ttl=1.0)
+        bot._cached_fetch_multi_exchange_prices("ETH", ttl=1.0)
+        bot._cached_fetch_multi_exchange_prices("BTC", ttl=1.0)
+        assert calls == ["BTC", "ETH"]
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Unit tests for MarketRegimeDetector rolling trend stats.
+
+Checks the running Welford mean/variance kept by update_prices() against
+the statistics module over the same sliding window of returns.
+"""
+
+import random
+import statistics
+import sys
+from pathlib import Path
+
+# Bot modules use flat imports (bot/ on sys.path)
+sys.path.append(str(Path(__file__).parent.parent / "bot"))
+
+import pytest
+
+mrd = pytest.importorskip("market_regime_detector", reason="bot dependencies not installed")
+MarketRegimeDetector = mrd.MarketRegimeDetector
+
+
+def reference_trend(prices):
+    """Trend metrics recomputed from scratch over the price window."""
+    if len(prices) < 3:
+        return {'trend': 'unknown', 'strength': 0, 'volatility': 0}
+
+    returns = [(prices[i] - prices[i-1]) / prices[i-1] for i in range(1, len(prices))]
+    mean_return = statistics.mean(returns)
+    trend = 'bullish' if mean_return > 0.001 else ('bearish' if mean_return < -0.001 else 'sideways')
+    positive_returns = sum(1 for r in returns if r > 0)
+    strength = abs(positive_returns / len(returns) - 0.5) * 2
+    volatility = statistics.stdev(returns) if len(returns) > 1 else 0
+    return {'trend': trend, 'strength': strength, 'volatility': volatility, 'mean_return': mean_return}
+
+
+def random_walk(n, start=100.0, step=0.01, seed=0):
+    rng = random.Random(seed)
+    prices = [start]
+    for _ in range(n - 1):
+        prices.append(prices[-1] * (1 + rng.gauss(0, step)))
+    return prices
+
+
+def assert_trend_matches(actual, expected):
+    assert actual['trend'] == expected['trend']
+    assert actual['strength'] == pytest.approx(expected['strength'])
+    assert actual['volatility'] == pytest.approx(expected['volatility'], rel=1e-9, abs=1e-15)
+    if 'mean_return' in expected:
+        assert actual['mean_return'] == pytest.approx(expected['mean_return'], rel=1e-9, abs=1e-15)
+
+
+class TestRollingTrendStats:
+    """Welford stats over the sliding price window."""
+
+    @pytest.mark.parametrize("lookback", [2, 3, 5, 10, 20])
+    def test_matches_statistics_every_update(self, lookback):
+        detector = MarketRegimeDetector(lookback_windows=lookback)
+        prices = random_walk(200, seed=lookback)
+        for i, price in enumerate(prices):
+            detector.update_prices('btc', price)
+            window = prices[max(0, i + 1 - lookback):i + 1]
+            assert_trend_matches(detector.calculate_trend('btc'), reference_trend(window))
+
+    def test_trending_series(self):
+        detector = MarketRegimeDetector(lookback_windows=10)
+        prices = [100 * 1.01 ** i for i in range(30)]
+        for price in prices:
+            detector.update_prices('eth', price)
+        result = detector.calculate_trend('eth')
+        assert_trend_matches(result, reference_trend(prices[-10:]))
+        assert result['trend'] == 'bullish'
+        assert result['strength'] == pytest.approx(1.0)
+
+    def test_flat_prices_zero_volatility(self):
+        detector = MarketRegimeDetector(lookback_windows=5)
+        for _ in range(20):
+            detector.update_prices('sol', 50.0)
+        result = detector.calculate_trend('sol')
+        assert result['volatility'] == 0
+        assert result['trend'] == 'sideways'
+
+    def test_no_drift_after_long_run(self):
+        detector = MarketRegimeDetector(lookback_windows=20)
+        prices = random_walk(20000, step=0.02, seed=42)
+        for price in prices:
+            detector.update_prices('xrp', price)
+        assert_trend_matches(detector.calculate_trend('xrp'), reference_trend(prices[-20:]))
+
+    def test_cryptos_tracked_independently(self):
+        detector = MarketRegimeDetector(lookback_windows=5)
+        btc = random_walk(12, seed=1)
+        eth = random_walk(12, seed=2)
+        for b, e in zip(btc, eth):
+            detector.update_prices('btc', b)
+            detector.update_prices('eth', e)
+        assert_trend_matches(detector.calculate_trend('btc'), reference_trend(btc[-5:]))
+        assert_trend_matches(detector.calculate_trend('eth'), reference_trend(eth[-5:]))
+
+    def test_untracked_crypto_ignored(self):
+        detector = MarketRegimeDetector(lookback_windows=5)
+        detector.update_prices('doge', 1.0)
+        assert 'doge' not in detector.price_history
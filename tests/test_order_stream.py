@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Unit tests for OrderFillStream.
+
+Tests fill accounting from user-channel events without opening a socket.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+# Bot modules use flat imports (bot/ on sys.path)
+sys.path.append(str(Path(__file__).parent.parent / "bot"))
+
+import pytest
+from order_stream import MAX_TRACKED_ORDERS, OrderFillStream
+
+
+def order_event(order_id, size_matched, event_type="UPDATE"):
+    return {"event_type": "order", "id": order_id, "type": event_type, "size_matched": str(size_matched)}
+
+
+def trade_event(order_id, size, status="MATCHED", trade_id="t1", side="TAKER"):
+    return {
+        "event_type": "trade", "id": trade_id, "status": status, "trader_side": side,
+        "taker_order_id": order_id, "size": str(size),
+        "maker_orders": [{"order_id": order_id, "matched_amount": str(size)}],
+    }
+
+
+@pytest.fixture
+def stream():
+    s = OrderFillStream(creds=None)
+    s.connected = True  # Pretend the socket is up; events are fed directly
+    return s
+
+
+def feed(stream, *events):
+    stream._handle_message(json.dumps(list(events)))
+
+
+class TestOrderFillStream:
+    """Fill accounting for OrderFillStream."""
+
+    def test_disconnected_returns_none(self):
+        s = OrderFillStream(creds=None)
+        assert s.wait_for_fill("o1", 10, timeout=0) is None
+
+    def test_order_update_sets_fill(self, stream):
+        feed(stream, order_event("o1", 4))
+        assert stream.wait_for_fill("o1", 10, timeout=0) == 4
+
+    def test_duplicate_order_events_not_added(self, stream):
+        feed(stream, order_event("o1", 10), order_event("o1", 10))
+        assert stream.wait_for_fill("o1", 10, timeout=0) == 10
+
+    def test_out_of_order_update_never_decreases(self, stream):
+        feed(stream, order_event("o1", 8), order_event("o1", 3))
+        assert stream.wait_for_fill("o1", 10, timeout=0) == 8
+
+    def test_taker_trade_does_not_double_count(self, stream):
+        feed(stream, order_event("o1", 10), trade_event("o1", 10))
+        assert stream.wait_for_fill("o1", 10, timeout=0) == 10
+
+    def test_trade_resent_per_status_ignored(self, stream):
+        feed(stream, trade_event("o1", 5, "MATCHED"), trade_event("o1", 5, "MINED"),
+             trade_event("o1", 5, "CONFIRMED"))
+        assert stream.wait_for_fill("o1", 10, timeout=0) == 0
+
+    def test_maker_trade_ignored(self, stream):
+        feed(stream, order_event("o1", 6), trade_event("o1", 6, side="MAKER"))
+        assert stream.wait_for_fill("o1", 10, timeout=0) == 6
+
+    def test_fill_capped_at_original_size(self, stream):
+        feed(stream, order_event("o1", 12))
+        assert stream.wait_for_fill("o1", 10, timeout=0) == 10
+
+    def test_cancellation_returns_partial_fill(self, stream):
+        feed(stream, order_event("o1", 3), order_event("o1", 3, "CANCELLATION"))
+        assert stream.wait_for_fill("o1", 10, timeout=1) == 3
+
+    def test_fill_before_wait_is_kept(self, stream):
+        feed(stream, order_event("o1", 10))
+        assert stream.wait_for_fill("o1", 10, timeout=5) == 10
+
+    def test_single_event_frame_and_non_json(self, stream):
+        stream._handle_message("PONG")
+        stream._handle_message(json.dumps(order_event("o1", 2)))
+        assert stream.wait_for_fill("o1", 10, timeout=0) == 2
+
+    def test_other_orders_unaffected(self, stream):
+        feed(stream, order_event("o1", 5), order_event("o2", 7))
+        assert stream.wait_for_fill("o1", 10, timeout=0) == 5
+        assert stream.wait_for_fill("o2", 10, timeout=0) == 7
+
+    def test_tracked_orders_bounded(self, stream):
+        feed(stream, *[order_event(f"o{i}", 1) for i in range(MAX_TRACKED_ORDERS + 10)])
+        assert len(stream._matched) == MAX_TRACKED_ORDERS
+        assert "o0" not in stream._matched
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the intra-epoch pattern lookup tables.
+
+Checks _pack_minutes and the table-driven analyze_pattern against the
+original rule-by-rule pattern logic for every Up/Down sequence.
+"""
+
+import itertools
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# Bot modules use flat imports (bot/ on sys.path)
+sys.path.append(str(Path(__file__).parent.parent / "bot"))
+# The bot opens its log files at import; keep them out of the repo root
+os.environ.setdefault("INTRA_LOG_DIR", tempfile.mkdtemp(prefix="intra_epoch_logs_"))
+
+import pytest
+
+bot = pytest.importorskip("intra_epoch_bot", reason="bot dependencies not installed")
+
+
+def reference_pattern(minutes):
+    """Pattern rules as written before the lookup tables (no candles)."""
+    if len(minutes) < 3:
+        return (None, 0.0, "Not enough data")
+
+    direction = None
+    base_accuracy = 0.0
+    base_reason = ""
+
+    # Pattern 1: 4+ of first 5 minutes same direction
+    if len(minutes) >= 5:
+        first_5 = minutes[:5]
+        ups = sum(1 for m in first_5 if m == 'Up')
+        downs = 5 - ups
+        if ups >= 4:
+            direction, base_accuracy, base_reason = 'Up', 0.797, f"{ups}/5 UP"
+        elif downs >= 4:
+            direction, base_accuracy, base_reason = 'Down', 0.740, f"{downs}/5 DOWN"
+
+    # Pattern 2: All first 3 minutes same direction
+    if direction is None:
+        first_3 = minutes[:3]
+        if all(m == 'Up' for m in first_3):
+            direction, base_accuracy, base_reason = 'Up', 0.780, "3/3 UP"
+        elif all(m == 'Down' for m in first_3):
+            direction, base_accuracy, base_reason = 'Down', 0.739, "3/3 DOWN"
+
+    if direction is None:
+        return (None, 0.0, "No strong pattern detected")
+    return (direction, base_accuracy, f"{base_reason} = {base_accuracy * 100:.1f}% accuracy")
+
+
+def all_sequences(max_len=9):
+    for length in range(0, max_len + 1):
+        for seq in itertools.product(('Up', 'Down'), repeat=length):
+            yield list(seq)
+
+
+class TestPackMinutes:
+    """Bitmask packing of minute directions."""
+
+    def test_docstring_example(self):
+        assert bot._pack_minutes(['Up', 'Down', 'Up']) == 0b101
+
+    def test_empty(self):
+        assert bot._pack_minutes([]) == 0
+
+    def test_bit_per_up_minute(self):
+        for minutes in all_sequences(6):
+            mask = bot._pack_minutes(minutes)
+            assert mask.bit_count() == minutes.count('Up')
+            for i, m in enumerate(minutes):
+                assert bool(mask >> i & 1) == (m == 'Up')
+
+
+class TestPatternTable:
+    """Table-driven analyze_pattern matches the original rules."""
+
+    def test_first5_table_covers_strong_patterns_only(self):
+        assert set(bot._FIRST5_PATTERN) <= set(range(32))
+        for mask, (direction, accuracy, _) in bot._FIRST5_PATTERN.items():
+            assert direction in ('Up', 'Down')
+            assert accuracy >= 0.739
+
+    def test_matches_reference_for_every_sequence(self):
+        for minutes in all_sequences():
+            assert bot.analyze_pattern(minutes) == reference_pattern(minutes), minutes
+
+    def test_precomputed_mask_matches(self):
+        for minutes in all_sequences():
+            if len(minutes) < 3:
+                continue
+            mask = bot._pack_minutes(minutes[:5])
+            assert bot.analyze_pattern(minutes, minutes_mask=mask) == reference_pattern(minutes), minutes
+
+    def test_mask_of_full_list_only_uses_first_five(self):
+        minutes = ['Down', 'Down', 'Up', 'Up', 'Up', 'Down', 'Down', 'Down']
+        full_mask = bot._pack_minutes(minutes)
+        assert bot.analyze_pattern(minutes, minutes_mask=full_mask) == reference_pattern(minutes)
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Unit tests for intra-epoch position sizing.
+
+Checks the POSITION_SIZE_TIERS-driven calculate_position_size against the
+original if/elif balance ladder, including every tier boundary.
+"""
+
+import os
+import random
+import sys
+import tempfile
+from pathlib import Path
+
+# Bot modules use flat imports (bot/ on sys.path)
+sys.path.append(str(Path(__file__).parent.parent / "bot"))
+# The bot opens its log files at import; keep them out of the repo root
+os.environ.setdefault("INTRA_LOG_DIR", tempfile.mkdtemp(prefix="intra_epoch_logs_"))
+
+import pytest
+
+bot = pytest.importorskip("intra_epoch_bot", reason="bot dependencies not installed")
+
+
+def reference_size(balance, accuracy, existing_size=0.0):
+    """Position sizing as written before the tier table."""
+    if balance < 50:
+        base = min(bot.BASE_POSITION_USD, balance * 0.15)
+    elif balance < 100:
+        base = min(bot.BASE_POSITION_USD, balance * 0.10)
+    elif balance < 200:
+        base = min(bot.BASE_POSITION_USD * 1.5, balance * 0.08)
+    else:
+        base = min(bot.MAX_POSITION_USD, balance * 0.05)
+
+    # Multiplier clamped to its documented 0.9-1.12 range
+    accuracy_multiplier = min(1.12, max(0.9, 0.9 + (accuracy - 0.74) * 2.0))
+
+    size = base * accuracy_multiplier
+    size = max(bot.MIN_BET_USD, min(bot.MAX_POSITION_USD, size))
+
+    if existing_size > 0:
+        max_add = bot.MAX_TOTAL_POSITION_USD - existing_size
+        size = min(size, max_add)
+
+    return round(size, 2)
+
+
+BOUNDARY_BALANCES = [0.0, 1.0, 7.33, 33.33, 49.99, 50.0, 50.01, 99.99, 100.0, 100.01,
+                     187.5, 199.99, 200.0, 200.01, 300.0, 1000.0, 1e6]
+ACCURACIES = [0.70, 0.735, 0.74, 0.76, 0.78, 0.797, 0.80, 0.85, 0.95]
+
+
+class TestPositionSizeTiers:
+    """Tier table matches the original balance ladder."""
+
+    def test_tiers_sorted_and_open_ended(self):
+        ceilings = [tier[0] for tier in bot.POSITION_SIZE_TIERS]
+        assert ceilings == sorted(ceilings)
+        assert ceilings[-1] == float('inf')
+
+    @pytest.mark.parametrize("balance", BOUNDARY_BALANCES)
+    def test_tier_boundaries(self, balance):
+        for accuracy in ACCURACIES:
+            assert bot.calculate_position_size(balance, accuracy) == reference_size(balance, accuracy)
+
+    def test_averaging_cap(self):
+        for existing in (0.0, 1.0, 5.0, 10.0, bot.MAX_TOTAL_POSITION_USD - 0.5):
+            for balance in (40.0, 150.0, 500.0):
+                got = bot.calculate_position_size(balance, 0.78, existing)
+                assert got == reference_size(balance, 0.78, existing)
+
+    def test_randomized(self):
+        rng = random.Random(7)
+        for _ in range(20000):
+            balance = rng.uniform(0, 500)
+            accuracy = rng.uniform(0.7, 0.9)
+            existing = rng.choice((0.0, rng.uniform(0, bot.MAX_TOTAL_POSITION_USD)))
+            assert (bot.calculate_position_size(balance, accuracy, existing)
+                    == reference_size(balance, accuracy, existing)), (balance, accuracy, existing)
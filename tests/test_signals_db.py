@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the intra-epoch signals database writer.
+
+Tests the queued writer thread, flush_signals_db and close_signals_db against
+a temporary SQLite file.
+"""
+
+import os
+import sqlite3
+import sys
+import tempfile
+from pathlib import Path
+
+# Bot modules use flat imports (bot/ on sys.path)
+sys.path.append(str(Path(__file__).parent.parent / "bot"))
+# The bot opens its log files at import; keep them out of the repo root
+os.environ.setdefault("INTRA_LOG_DIR", tempfile.mkdtemp(prefix="intra_epoch_logs_"))
+
+import pytest
+
+bot = pytest.importorskip("intra_epoch_bot", reason="bot dependencies not installed")
+
+
+@pytest.fixture
+def signals_db(tmp_path, monkeypatch):
+    """Point the bot at a fresh database file and stop its writer afterwards."""
+    db_file = tmp_path / "intra_signals.db"
+    monkeypatch.setattr(bot, "SIGNALS_DB_FILE", db_file)
+    monkeypatch.setattr(bot, "_signals_db", None)
+    monkeypatch.setattr(bot, "_db_writer_thread", None)
+    yield db_file
+    bot.close_signals_db()
+    if bot._signals_db is not None:
+        bot._signals_db.close()
+
+
+def log_signal(crypto="btc", epoch=1000, decision="TRADE", entry_price=0.55):
+    return bot.log_signal_to_db(
+        crypto, epoch, "Up", 0.78, 0.2, 0.01, "Up", 2, 0.1, 0.79, entry_price, decision, "test",
+    )
+
+
+def log_trade(crypto="btc", epoch=1000, size=5.0):
+    return bot.log_trade_to_db(crypto, epoch, "Up", 0.55, size, 0.78, 0.2, 2)
+
+
+def query(db_file, sql, *params):
+    conn = sqlite3.connect(str(db_file))
+    try:
+        return conn.execute(sql, params).fetchall()
+    finally:
+        conn.close()
+
+
+class TestSignalsDbWriter:
+    """Queued writes to the signals database."""
+
+    def test_flush_without_writer_returns_true(self, signals_db):
+        assert bot.flush_signals_db(timeout=0) is True
+        assert not signals_db.exists()
+
+    def test_close_without_writer_is_noop(self, signals_db):
+        bot.close_signals_db(timeout=0)
+
+    def test_flush_commits_queued_signals(self, signals_db):
+        for epoch in range(1000, 1010):
+            assert log_signal(epoch=epoch)
+        assert bot.flush_signals_db()
+        assert query(signals_db, "SELECT COUNT(*) FROM signals") == [(10,)]
+
+    def test_relogging_signal_updates_in_place(self, signals_db):
+        log_signal(decision="SKIP_WEAK")
+        assert bot.flush_signals_db()
+        first_id = query(signals_db, "SELECT id FROM signals")[0][0]
+
+        log_signal(decision="TRADE")
+        assert bot.flush_signals_db()
+        assert query(signals_db, "SELECT id, decision FROM signals") == [(first_id, "TRADE")]
+
+    def test_trade_linked_to_signal_in_same_batch(self, signals_db):
+        log_signal(crypto="eth", epoch=2000)
+        log_trade(crypto="eth", epoch=2000)
+        assert bot.flush_signals_db()
+        rows = query(signals_db, """
+            SELECT t.size FROM trades t JOIN signals s ON t.signal_id = s.id
+            WHERE t.crypto = 'eth' AND t.epoch = 2000
+        """)
+        assert rows == [(5.0,)]
+
+    def test_outcome_updates_trade(self, signals_db):
+        log_signal()
+        log_trade()
+        bot.update_trade_outcome("btc", 1000, "WIN", 4.1)
+        assert bot.flush_signals_db()
+        assert query(signals_db, "SELECT outcome, pnl FROM trades") == [("WIN", 4.1)]
+
+    def test_bad_row_does_not_drop_batch(self, signals_db):
+        log_signal(epoch=1000)
+        log_signal(epoch=1001, decision=None)  # violates NOT NULL
+        log_signal(epoch=1002)
+        assert bot.flush_signals_db()
+        assert query(signals_db, "SELECT epoch FROM signals ORDER BY epoch") == [(1000,), (1002,)]
+
+    def test_close_applies_pending_writes(self, signals_db):
+        log_signal(epoch=1000)
+        log_trade(epoch=1000)
+        writer = bot._db_writer_thread
+        bot.close_signals_db()
+        assert not writer.is_alive()
+        assert query(signals_db, "SELECT COUNT(*) FROM trades") == [(1,)]
+        # Flushing after close must not block
+        assert bot.flush_signals_db(timeout=0) is True